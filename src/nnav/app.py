@@ -13,7 +13,7 @@ from textual.widgets import DataTable, Footer, Header, Input, Static
 from textual.widgets.data_table import RowKey
 
 from nnav.config import ColumnsConfig, HideConfig, ThemeConfig
-from nnav.constants import CLEAR_DOUBLE_PRESS_TIMEOUT, PAYLOAD_PREVIEW_WIDTH
+from nnav.constants import CLEAR_DOUBLE_PRESS_TIMEOUT
 from nnav.core.filter import MessageFilter
 from nnav.messages import load_messages
 from nnav.nats_client import JetStreamConfig, MessageType, NatsMessage, NatsSubscriber
@@ -21,7 +21,9 @@ from nnav.themes import build_themes
 from nnav.ui import (
     CURSOR_BINDINGS,
     FULLSCREEN_BINDING,
+    FULLSCREEN_CLASS,
     FULLSCREEN_CSS,
+    ClipboardMixin,
     ConnectionInfoScreen,
     DiffScreen,
     ExportScreen,
@@ -36,10 +38,10 @@ from nnav.ui import (
     SubjectNode,
     SubjectTreeScreen,
 )
-from nnav.utils.clipboard import copy_to_clipboard
+from nnav.utils.formatting import format_timestamp, pretty_json
 
 
-class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
+class NatsVisApp(ClipboardMixin, FilterMixin, FullscreenMixin, App[None]):
     TITLE = "nnav"
 
     CSS = """
@@ -116,10 +118,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         Binding("R", "export_range", "Export Range", show=False),
         Binding("y", "copy_payload", "Copy", show=False),
         Binding("Y", "copy_message", "Copy Message", show=False),
-        Binding("j", "cursor_down", "Down", show=False),
-        Binding("k", "cursor_up", "Up", show=False),
-        Binding("g", "cursor_top", "Top", show=False),
-        Binding("G", "cursor_bottom", "Bottom", show=False),
+        *CURSOR_BINDINGS,
         Binding("ctrl+d", "page_down", "Page Down", show=False),
         Binding("ctrl+u", "page_up", "Page Up", show=False),
         Binding("t", "subject_tree", "Subject Tree"),
@@ -149,7 +148,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
             self.register_theme(custom_theme)
         self.theme = textual_theme
         self.preview_theme = preview_theme
-        self._fullscreen = fullscreen
+        self._start_fullscreen = fullscreen
         self.hide = hide or HideConfig()
         self.columns = columns or ColumnsConfig()
         self.export_path = export_path
@@ -171,6 +170,8 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         self.messages: list[StoredMessage] = []
         self.filtered_indices: list[int] = []
         self.bookmark_indices: list[int] = []
+        # Subjects of all non-hidden messages, kept up to date as they arrive
+        self._subject_tree = self._new_subject_tree()
         # Map reply_to subject -> request message index for RPC tracking
         self._pending_requests: dict[str, int] = {}
         # Double-press confirmation for clear
@@ -191,13 +192,13 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
     def compose(self) -> ComposeResult:
         yield Header()
         with Container(id="main-container"):
-            yield DataTable()
+            yield DataTable(id="table")
         yield FilterInput(placeholder="Filter (text or /regex/)...", id="filter")
         yield Static("", id="status-bar")
         yield Footer()
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        table = self._get_table()
         # Build columns based on config
         cols = []
         if self.columns.marker:
@@ -219,8 +220,8 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         self.call_after_refresh(table.focus)
 
         # Apply fullscreen mode if configured
-        if self._fullscreen:
-            self.add_class("fullscreen")
+        if self._start_fullscreen:
+            self.add_class(FULLSCREEN_CLASS)
 
         if self.viewer_mode and self.import_file:
             # Load imported messages
@@ -241,7 +242,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
     def _load_filter_history(self) -> None:
         """Load filter history from file."""
-        filter_input = self.query_one("#filter", FilterInput)
+        filter_input = self._get_filter_input()
         try:
             if self._history_file.exists():
                 history = json.loads(self._history_file.read_text())
@@ -252,7 +253,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
     def _save_filter_history(self) -> None:
         """Save filter history to file."""
-        filter_input = self.query_one("#filter", FilterInput)
+        filter_input = self._get_filter_input()
         try:
             self._history_file.parent.mkdir(parents=True, exist_ok=True)
             self._history_file.write_text(json.dumps(filter_input.get_history()))
@@ -296,6 +297,10 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
             if pending > 0:
                 parts.append(f"Pending: {pending}")
 
+            dropped = self.subscriber.dropped_count
+            if dropped > 0:
+                parts.append(f"Dropped: {dropped}")
+
         bookmarks = len(self.bookmark_indices)
         if bookmarks > 0:
             parts.append(f"Bookmarks: {bookmarks}")
@@ -349,7 +354,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
     def _add_message(self, msg: NatsMessage, imported: bool = False) -> None:
         """Add a message to the table."""
-        table = self.query_one(DataTable)
+        table = self._get_table()
 
         stored = StoredMessage(msg=msg, row_key=None, imported=imported)
         msg_index = len(self.messages)
@@ -375,6 +380,8 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         if self._should_hide_message(msg):
             return
 
+        self._subject_tree.insert(msg.subject)
+
         # Check filters
         if not self._matches_filter(msg):
             return
@@ -393,12 +400,10 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         self, msg: NatsMessage, stored: StoredMessage
     ) -> list[str | Text]:
         """Build row data for a message based on enabled columns."""
-        time_str = msg.timestamp.strftime("%H:%M:%S.%f")[:-3]
+        time_str = format_timestamp(msg.timestamp, with_date=False)
         type_str = msg.message_type.value
         latency_str = f"{msg.latency_ms:.1f}ms" if msg.latency_ms else ""
-        payload_display = msg.payload.replace("\n", " ")[:PAYLOAD_PREVIEW_WIDTH]
-        if len(msg.payload) > PAYLOAD_PREVIEW_WIDTH:
-            payload_display += "..."
+        payload_display = msg.payload_preview()
 
         # Marker: bookmark takes precedence, then imported
         if stored.bookmarked:
@@ -437,7 +442,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
     def _get_selected_index(self) -> int | None:
         """Get the index into self.messages for the selected row."""
-        table = self.query_one(DataTable)
+        table = self._get_table()
         if table.cursor_row is None or table.cursor_row < 0:
             return None
         if 0 <= table.cursor_row < len(self.filtered_indices):
@@ -479,7 +484,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
         self.push_screen(
             MessageDetailScreen(
-                stored, self.preview_theme, fullscreen=self._fullscreen
+                stored, self.preview_theme, fullscreen=self.has_class(FULLSCREEN_CLASS)
             ),
             handle_result,
         )
@@ -487,18 +492,20 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle filter input submission."""
         if event.input.id == "filter":
-            self.filter_text = event.value
-            self.message_filter.set_tree_prefix(
-                None
-            )  # Clear tree prefix for manual filters
-            self._parse_filter_terms(event.value)
-            self._apply_filter()
+            # Re-filtering rebuilds the table, so skip it if nothing changed
+            if event.value != self.filter_text or self.message_filter.state.tree_prefix:
+                self.filter_text = event.value
+                self.message_filter.set_tree_prefix(
+                    None
+                )  # Clear tree prefix for manual filters
+                self._parse_filter_terms(event.value)
+                self._apply_filter()
             # Add to history and save
-            filter_input = self.query_one("#filter", FilterInput)
+            filter_input = self._get_filter_input()
             filter_input.add_to_history(event.value)
             self._save_filter_history()
             if not event.value:  # Only hide if filter is empty
-                event.input.remove_class("visible")
+                self._hide_filter_input()
             self._focus_table()
 
     def _parse_filter_terms(self, filter_text: str) -> None:
@@ -510,7 +517,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
     def _apply_filter(self) -> None:
         """Apply the current filter to messages."""
-        table = self.query_one(DataTable)
+        table = self._get_table()
         table.clear()
         self.filtered_indices.clear()
 
@@ -536,7 +543,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         if not self.columns.marker:
             return
 
-        table = self.query_one(DataTable)
+        table = self._get_table()
         if stored.row_key is not None:
             # Bookmark takes precedence, then imported marker
             if stored.bookmarked:
@@ -564,11 +571,12 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
             and (now - self._last_clear_press) < CLEAR_DOUBLE_PRESS_TIMEOUT
         ):
             # Second press - clear messages
-            table = self.query_one(DataTable)
+            table = self._get_table()
             table.clear()
             self.messages.clear()
             self.filtered_indices.clear()
             self.bookmark_indices.clear()
+            self._subject_tree = self._new_subject_tree()
             self._last_clear_press = None
             self._update_status()
             self.notify("Messages cleared")
@@ -595,7 +603,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         self._update_status()
         if self.tail_mode:
             self.notify("Tail mode on - following new messages")
-            self.query_one(DataTable).scroll_end()
+            self._get_table().scroll_end()
         else:
             self.notify("Tail mode off - scroll freely")
 
@@ -723,14 +731,14 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
                 # Find row in filtered indices
                 if idx in self.filtered_indices:
                     row = self.filtered_indices.index(idx)
-                    self.query_one(DataTable).move_cursor(row=row)
+                    self._get_table().move_cursor(row=row)
                     return
 
         # Wrap around to first
         idx = self.bookmark_indices[0]
         if idx in self.filtered_indices:
             row = self.filtered_indices.index(idx)
-            self.query_one(DataTable).move_cursor(row=row)
+            self._get_table().move_cursor(row=row)
 
     def action_prev_bookmark(self) -> None:
         """Go to previous bookmarked message."""
@@ -747,14 +755,14 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
             if idx < current:
                 if idx in self.filtered_indices:
                     row = self.filtered_indices.index(idx)
-                    self.query_one(DataTable).move_cursor(row=row)
+                    self._get_table().move_cursor(row=row)
                     return
 
         # Wrap around to last
         idx = self.bookmark_indices[-1]
         if idx in self.filtered_indices:
             row = self.filtered_indices.index(idx)
-            self.query_one(DataTable).move_cursor(row=row)
+            self._get_table().move_cursor(row=row)
 
     def action_diff_bookmarks(self) -> None:
         """Diff two bookmarked messages."""
@@ -770,22 +778,14 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
 
         # Use first two bookmarks
         self.push_screen(
-            DiffScreen(bookmarked[0].msg, bookmarked[1].msg, self.preview_theme)
+            DiffScreen(bookmarked[0], bookmarked[1], self.preview_theme)
         )
 
     def action_copy_payload(self) -> None:
         """Copy selected message payload to clipboard."""
-        msg = self._get_selected_message()
-        if msg:
-            try:
-                parsed = json.loads(msg.payload)
-                text = json.dumps(parsed, indent=2)
-            except json.JSONDecodeError:
-                text = msg.payload
-            if copy_to_clipboard(text):
-                self.notify("Payload copied")
-            else:
-                self.notify("Clipboard not available", severity="warning")
+        stored = self._get_selected_stored()
+        if stored:
+            self._copy_text(stored.formatted_payload(), "Payload copied")
 
     def _message_to_dict(self, msg: NatsMessage) -> dict[str, object]:
         """Convert a message to a dictionary for JSON serialization."""
@@ -820,14 +820,11 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
                 )
                 data[key] = self._message_to_dict(related)
 
-            if copy_to_clipboard(json.dumps(data, indent=2)):
-                self.notify("Message copied")
-            else:
-                self.notify("Clipboard not available", severity="warning")
+            self._copy_text(pretty_json(data), "Message copied")
 
     def action_cursor_down(self) -> None:
         """Move cursor down (vim j)."""
-        table = self.query_one(DataTable)
+        table = self._get_table()
         # Disable tail mode if not already at bottom
         if self.tail_mode and table.cursor_row < table.row_count - 1:
             self.tail_mode = False
@@ -839,18 +836,18 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         if self.tail_mode:
             self.tail_mode = False
             self._update_status()
-        self.query_one(DataTable).action_cursor_up()
+        self._get_table().action_cursor_up()
 
     def action_cursor_top(self) -> None:
         """Move cursor to top (vim g)."""
         if self.tail_mode:
             self.tail_mode = False
             self._update_status()
-        self.query_one(DataTable).move_cursor(row=0)
+        self._get_table().move_cursor(row=0)
 
     def action_cursor_bottom(self) -> None:
         """Move cursor to bottom (vim G)."""
-        table = self.query_one(DataTable)
+        table = self._get_table()
         table.move_cursor(row=table.row_count - 1)
 
     def action_page_down(self) -> None:
@@ -858,40 +855,19 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         if self.tail_mode:
             self.tail_mode = False
             self._update_status()
-        self.query_one(DataTable).action_page_down()
+        self._get_table().action_page_down()
 
     def action_page_up(self) -> None:
         """Page up (vim ctrl+u)."""
         if self.tail_mode:
             self.tail_mode = False
             self._update_status()
-        self.query_one(DataTable).action_page_up()
-
-    def _build_subject_tree(self) -> SubjectNode:
-        """Build a tree from all message subjects."""
-        root = SubjectNode(name="", full_subject="", count=0, children={})
+        self._get_table().action_page_up()
 
-        for stored in self.messages:
-            # Skip hidden subjects
-            if self._should_hide_message(stored.msg):
-                continue
-
-            subject = stored.msg.subject
-            parts = subject.split(".")
-            current = root
-
-            for i, part in enumerate(parts):
-                if part not in current.children:
-                    full_subject = ".".join(parts[: i + 1])
-                    current.children[part] = SubjectNode(
-                        name=part, full_subject=full_subject, count=0, children={}
-                    )
-                current = current.children[part]
-
-            # Increment count at leaf
-            current.count += 1
-
-        return root
+    @staticmethod
+    def _new_subject_tree() -> SubjectNode:
+        """Create an empty subject tree root."""
+        return SubjectNode(name="", full_subject="", count=0, children={})
 
     def action_subject_tree(self) -> None:
         """Show subject tree view."""
@@ -899,8 +875,6 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
             self.notify("No messages to show", severity="warning")
             return
 
-        root = self._build_subject_tree()
-
         def handle_result(subject_pattern: str | None) -> None:
             if subject_pattern:
                 # Set prefix for subject display stripping
@@ -920,7 +894,7 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
                 self._apply_filter()
                 self.notify(f"Filtering: {subject_pattern}")
 
-        self.push_screen(SubjectTreeScreen(root), handle_result)
+        self.push_screen(SubjectTreeScreen(self._subject_tree), handle_result)
 
     def _show_jetstream_browser(self) -> None:
         """Show the JetStream browser screen."""
@@ -931,11 +905,12 @@ class NatsVisApp(FilterMixin, FullscreenMixin, App[None]):
         def handle_result(config: JetStreamConfig | None) -> None:
             if config:
                 # Clear existing messages and restart with new JetStream subscription
-                table = self.query_one(DataTable)
+                table = self._get_table()
                 table.clear()
                 self.messages.clear()
                 self.filtered_indices.clear()
                 self.bookmark_indices.clear()
+                self._subject_tree = self._new_subject_tree()
                 self._pending_requests.clear()
 
                 self.jetstream_config = config
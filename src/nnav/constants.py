@@ -2,6 +2,14 @@
 
 # Display settings
 PAYLOAD_PREVIEW_WIDTH = 80
+PIPE_OUTPUT_LIMIT = 1024 * 1024  # bytes of pipe command output kept
+FILTER_HISTORY_SIZE = 50  # filters remembered for up/down recall
+
+# File settings
+EXPORT_BUFFER_SIZE = 1024 * 1024  # bytes buffered per export file write
+
+# Subscriber settings
+SUBSCRIBER_QUEUE_SIZE = 10_000  # messages buffered before dropping
 
 # UI timing
 CLEAR_DOUBLE_PRESS_TIMEOUT = 1.5  # seconds
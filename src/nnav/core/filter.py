@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 
 from nnav.config import HideConfig
 from nnav.nats_client import MessageType, NatsMessage
-from nnav.utils.patterns import matches_nats_pattern
+from nnav.utils.patterns import is_nats_pattern, matches_nats_pattern
 
 
 @dataclass
@@ -138,7 +138,7 @@ class MessageFilter:
         """Check if a single term matches the message."""
         if term.regex:
             return bool(term.regex.search(msg.subject) or term.regex.search(msg.payload))
-        elif ">" in term.text or "*" in term.text:
+        elif is_nats_pattern(term.text):
             return matches_nats_pattern(msg.subject, term.text)
         else:
             term_lower = term.text.lower()
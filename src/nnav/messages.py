@@ -2,10 +2,13 @@
 
 import json
 import re
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from pathlib import Path
 
+from nnav.constants import EXPORT_BUFFER_SIZE
 from nnav.nats_client import MessageType, NatsMessage
+from nnav.utils.formatting import encode_json
 from nnav.utils.patterns import matches_nats_pattern
 
 
@@ -78,6 +81,15 @@ def parse_json_format(data: list[dict[str, object]]) -> list[NatsMessage]:
                 except ValueError:
                     pass
 
+            # Parse payload size (hex-encoded binary payloads are longer)
+            size_raw = item.get("payload_size")
+            payload_size = -1
+            if size_raw is not None:
+                try:
+                    payload_size = int(str(size_raw))
+                except ValueError:
+                    pass
+
             messages.append(
                 NatsMessage(
                     subject=str(item.get("subject", "")),
@@ -92,6 +104,7 @@ def parse_json_format(data: list[dict[str, object]]) -> list[NatsMessage]:
                         if item.get("request_subject")
                         else None
                     ),
+                    payload_size=payload_size,
                 )
             )
         except Exception:
@@ -289,13 +302,40 @@ def export_messages(
             "headers": m.headers,
             "latency_ms": m.latency_ms,
             "request_subject": m.request_subject,
+            "payload_size": m.payload_size,
         }
         for m in messages
     ]
 
-    with path.open("w") as f:
-        if format == "ndjson":
-            for item in data:
-                f.write(json.dumps(item) + "\n")
-        else:
-            json.dump(data, f, indent=2)
+    if format == "ndjson":
+        write_ndjson(path, data)
+    else:
+        write_json(path, data)
+
+
+def write_json(path: Path, items: Sequence[Mapping[str, object]]) -> None:
+    """Write items to a file as an indented JSON array.
+
+    The whole document is encoded up front and written in one call;
+    json.dump would issue a write per token.
+
+    Args:
+        path: Output file path
+        items: JSON-serializable objects
+    """
+    with path.open("wb", buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(encode_json(items, indent=True))
+
+
+def write_ndjson(path: Path, items: Iterable[Mapping[str, object]]) -> None:
+    """Write items to a file as newline-delimited JSON.
+
+    Lines are encoded one at a time and handed to a large binary buffer,
+    so writes are coalesced without building the whole file in memory.
+
+    Args:
+        path: Output file path
+        items: JSON-serializable objects, one per line
+    """
+    with path.open("wb", buffering=EXPORT_BUFFER_SIZE) as f:
+        f.writelines(encode_json(item) + b"\n" for item in items)
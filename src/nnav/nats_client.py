@@ -1,6 +1,7 @@
 """NATS client for subscribing to messages."""
 
 import asyncio
+import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,6 +12,8 @@ from nats.aio.client import Client
 from nats.aio.msg import Msg
 from nats.js.api import ConsumerConfig, DeliverPolicy
 
+from nnav.constants import PAYLOAD_PREVIEW_WIDTH, SUBSCRIBER_QUEUE_SIZE
+
 
 class MessageType(Enum):
     """Type of NATS message."""
@@ -54,6 +57,24 @@ class NatsMessage:
     # JetStream metadata
     js_sequence: int | None = None
     js_stream: str | None = None
+    # Size of the payload on the wire in bytes; derived from payload if negative.
+    # Binary payloads are stored hex-encoded, so pass their real size.
+    payload_size: int = -1
+
+    def __post_init__(self) -> None:
+        if self.payload_size < 0:
+            self.payload_size = len(self.payload.encode())
+
+    def payload_preview(self, n: int = PAYLOAD_PREVIEW_WIDTH) -> str:
+        """Single-line preview of the first n characters of the payload.
+
+        Only the visible slice is copied, so large payloads cost the same
+        to preview as small ones.
+        """
+        preview = self.payload[:n].replace("\n", " ")
+        if len(self.payload) > n:
+            preview += "..."
+        return preview
 
 
 class RpcTracker:
@@ -61,39 +82,45 @@ class RpcTracker:
 
     def __init__(self, timeout_seconds: float = 30.0) -> None:
         self.timeout_seconds = timeout_seconds
-        self._pending_requests: dict[str, tuple[NatsMessage, datetime]] = {}
+        # reply_to -> (request, monotonic start time, monotonic deadline).
+        # Kept in insertion order, so deadlines are ascending.
+        self._pending_requests: dict[str, tuple[NatsMessage, float, float]] = {}
 
     def track_request(self, msg: NatsMessage) -> None:
         """Track a request message for later correlation."""
         if msg.reply_to:
-            self._pending_requests[msg.reply_to] = (msg, datetime.now())
+            now = time.monotonic()
+            # Re-insert so a reused reply subject moves to the end of the order
+            self._pending_requests.pop(msg.reply_to, None)
+            self._pending_requests[msg.reply_to] = (
+                msg,
+                now,
+                now + self.timeout_seconds,
+            )
 
     def match_response(self, msg: NatsMessage) -> NatsMessage | None:
         """Try to match a response to a pending request."""
         if msg.subject in self._pending_requests:
-            request, request_time = self._pending_requests.pop(msg.subject)
+            request, started, _ = self._pending_requests.pop(msg.subject)
             msg.correlation_id = request.subject
             msg.request_subject = request.subject
-            msg.latency_ms = (msg.timestamp - request_time).total_seconds() * 1000
+            msg.latency_ms = (time.monotonic() - started) * 1000
             msg.message_type = MessageType.RESPONSE
             return request
         return None
 
     def get_timed_out_requests(self) -> list[NatsMessage]:
         """Get requests that have timed out without a response."""
-        now = datetime.now()
-        timed_out: list[NatsMessage] = []
-        to_remove: list[str] = []
+        now = time.monotonic()
+        timed_out: list[str] = []
 
-        for reply_to, (request, request_time) in self._pending_requests.items():
-            if (now - request_time).total_seconds() > self.timeout_seconds:
-                timed_out.append(request)
-                to_remove.append(reply_to)
+        # Deadlines are ascending, so stop at the first live request
+        for reply_to, (_, _, deadline) in self._pending_requests.items():
+            if now <= deadline:
+                break
+            timed_out.append(reply_to)
 
-        for reply_to in to_remove:
-            del self._pending_requests[reply_to]
-
-        return timed_out
+        return [self._pending_requests.pop(reply_to)[0] for reply_to in timed_out]
 
     @property
     def pending_count(self) -> int:
@@ -111,6 +138,7 @@ class NatsSubscriber:
         password: str | None = None,
         subject: str = ">",
         rpc_timeout: float = 30.0,
+        queue_size: int = SUBSCRIBER_QUEUE_SIZE,
     ) -> None:
         self.server_url = server_url
         self.user = user
@@ -118,6 +146,9 @@ class NatsSubscriber:
         self.subject = subject
         self._client: Client | None = None
         self.rpc_tracker = RpcTracker(timeout_seconds=rpc_timeout)
+        # Bounded so a stalled UI can't grow memory without limit
+        self._queue: asyncio.Queue[Msg] = asyncio.Queue(maxsize=queue_size)
+        self.dropped_count = 0
 
     async def connect(self) -> None:
         """Connect to the NATS server."""
@@ -164,30 +195,35 @@ class NatsSubscriber:
         if not self._client:
             raise RuntimeError("Not connected to NATS server")
 
-        queue: list[Msg] = []
+        queue = self._queue
 
         async def message_handler(msg: Msg) -> None:
-            queue.append(msg)
+            try:
+                queue.put_nowait(msg)
+            except asyncio.QueueFull:
+                # Slow consumer - drop the newest message rather than buffer
+                self.dropped_count += 1
 
         sub = await self._client.subscribe(self.subject, cb=message_handler)
+        await self._client.flush()
 
         try:
             while True:
-                if queue:
-                    raw_msg = queue.pop(0)
-                    msg = self._process_message(raw_msg)
+                raw_msg = await queue.get()
+                msg = self._process_message(raw_msg)
+
+                # Check if this is a response to a tracked request
+                self.rpc_tracker.match_response(msg)
 
-                    # Check if this is a response to a tracked request
-                    self.rpc_tracker.match_response(msg)
+                # Track if this is a request (has reply_to)
+                if msg.reply_to:
+                    self.rpc_tracker.track_request(msg)
 
-                    # Track if this is a request (has reply_to)
-                    if msg.reply_to:
-                        self.rpc_tracker.track_request(msg)
+                yield msg
 
-                    yield msg
-                else:
-                    await self._client.flush()
-                    await asyncio.sleep(0.01)
+                # queue.get() doesn't suspend while a backlog remains, so
+                # yield explicitly to let the UI render between messages
+                await asyncio.sleep(0)
         finally:
             await sub.unsubscribe()
 
@@ -220,6 +256,7 @@ class NatsSubscriber:
             reply_to=reply_to,
             headers=headers,
             message_type=msg_type,
+            payload_size=len(raw_msg.data),
         )
 
     async def subscribe_jetstream(
@@ -295,4 +332,5 @@ class NatsSubscriber:
             message_type=MessageType.PUBLISH,
             js_sequence=js_sequence,
             js_stream=stream,
+            payload_size=len(raw_msg.data),
         )
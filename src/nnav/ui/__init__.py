@@ -7,7 +7,10 @@ from nnav.ui.jetstream_screens import (
 )
 from nnav.ui.mixins import (
     CURSOR_BINDINGS,
+    FILTER_VISIBLE_CLASS,
     FULLSCREEN_BINDING,
+    FULLSCREEN_CLASS,
+    ClipboardMixin,
     FilterMixin,
     FullscreenMixin,
 )
@@ -31,13 +34,16 @@ from nnav.ui.styles import (
 from nnav.ui.widgets import FilterInput
 
 __all__ = [
+    "ClipboardMixin",
     "ConnectionInfoScreen",
     "ConsumerListScreen",
     "CURSOR_BINDINGS",
     "DIALOG_BASE_CSS",
     "DiffScreen",
     "ExportScreen",
+    "FILTER_VISIBLE_CLASS",
     "FULLSCREEN_BINDING",
+    "FULLSCREEN_CLASS",
     "FULLSCREEN_CSS",
     "FilterInput",
     "FilterMixin",
@@ -103,7 +103,10 @@ class StartPositionScreen(ModalScreen[JetStreamConfig | None]):
             yield Label("Enter: Select | Esc: Cancel", id="hint")
 
     def on_mount(self) -> None:
-        self.query_one(OptionList).focus()
+        self._options = self.query_one(OptionList)
+        self._seq_container = self.query_one("#seq-container")
+        self._seq_input = self.query_one("#seq-input", Input)
+        self._options.focus()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         option_id = event.option.id
@@ -124,8 +127,8 @@ class StartPositionScreen(ModalScreen[JetStreamConfig | None]):
             )
         elif option_id == "seq":
             # Show sequence input
-            self.query_one("#seq-container").add_class("visible")
-            self.query_one("#seq-input", Input).focus()
+            self._seq_container.add_class("visible")
+            self._seq_input.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "seq-input":
@@ -145,10 +148,10 @@ class StartPositionScreen(ModalScreen[JetStreamConfig | None]):
         self.dismiss(None)
 
     def action_cursor_down(self) -> None:
-        self.query_one(OptionList).action_cursor_down()
+        self._options.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        self.query_one(OptionList).action_cursor_up()
+        self._options.action_cursor_up()
 
 
 class ConsumerListScreen(ModalScreen[None]):
@@ -203,25 +206,28 @@ class ConsumerListScreen(ModalScreen[None]):
             yield Label("Esc: Close | jk: Navigate", id="hint")
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        table = self._table = self.query_one(DataTable)
         table.add_columns("Name", "Pending", "Ack Pending", "Redelivered", "Waiting")
         table.cursor_type = "row"
 
-        for consumer in self.consumers:
-            name = consumer.name or "?"
-            pending = consumer.num_pending or 0
-            ack_pending = consumer.num_ack_pending or 0
-            redelivered = consumer.num_redelivered or 0
-            waiting = consumer.num_waiting or 0
-            table.add_row(name, str(pending), str(ack_pending), str(redelivered), str(waiting))
+        table.add_rows(
+            (
+                consumer.name or "?",
+                str(consumer.num_pending or 0),
+                str(consumer.num_ack_pending or 0),
+                str(consumer.num_redelivered or 0),
+                str(consumer.num_waiting or 0),
+            )
+            for consumer in self.consumers
+        )
 
         table.focus()
 
     def action_cursor_down(self) -> None:
-        self.query_one(DataTable).action_cursor_down()
+        self._table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        self.query_one(DataTable).action_cursor_up()
+        self._table.action_cursor_up()
 
 
 class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
@@ -291,6 +297,8 @@ class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
         self.streams: list[StreamInfo] = []
         self.filtered_streams: list[StreamInfo] = []
         self.filter_text: str = ""
+        # (lowercased name, formatted row, stream) built once per load
+        self._stream_rows: list[tuple[str, tuple[str, ...], StreamInfo]] = []
 
     def compose(self) -> ComposeResult:
         with Container(id="browser-dialog"):
@@ -302,7 +310,10 @@ class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
             yield Label("Enter: Watch | r: Refresh | c: Consumers | Esc: Cancel", id="browser-hint")
 
     def on_mount(self) -> None:
-        table = self.query_one("#streams-table", DataTable)
+        table = self._table = self.query_one("#streams-table", DataTable)
+        self._status = self.query_one("#browser-status", Static)
+        self._filter_container = self.query_one("#filter-container")
+        self._filter_input = self.query_one("#stream-filter", Input)
         table.add_columns("Stream", "Messages", "Bytes", "Subjects", "Consumers")
         table.cursor_type = "row"
         table.focus()
@@ -321,18 +332,34 @@ class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
         try:
             streams = await js.streams_info()
             self.streams = list(streams)
+            self._stream_rows = [self._format_stream(stream) for stream in self.streams]
             self._apply_filter()
             self._update_status(f"Streams: {len(self.streams)}")
         except Exception as e:
             self._update_status(f"Error: {e}")
 
+    @staticmethod
+    def _format_stream(
+        stream: StreamInfo,
+    ) -> tuple[str, tuple[str, ...], StreamInfo]:
+        """Format a stream's table row once so filtering only matches names."""
+        name = stream.config.name or "?"
+        row = (
+            name,
+            f"{stream.state.messages:,}",
+            format_bytes(stream.state.bytes),
+            str(len(stream.config.subjects or [])),
+            str(stream.state.consumer_count),
+        )
+        return name.lower(), row, stream
+
     def _update_status(self, text: str) -> None:
         """Update status bar."""
-        self.query_one("#browser-status", Static).update(text)
+        self._status.update(text)
 
     def _get_selected_stream(self) -> StreamInfo | None:
         """Get the currently selected stream."""
-        table = self.query_one("#streams-table", DataTable)
+        table = self._table
         if table.cursor_row is None or table.cursor_row < 0:
             return None
         if 0 <= table.cursor_row < len(self.filtered_streams):
@@ -381,9 +408,8 @@ class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
 
     def action_start_filter(self) -> None:
         """Show filter input."""
-        container = self.query_one("#filter-container")
-        container.add_class("visible")
-        self.query_one("#stream-filter", Input).focus()
+        self._filter_container.add_class("visible")
+        self._filter_input.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle filter input submission."""
@@ -391,50 +417,38 @@ class JetStreamBrowserScreen(ModalScreen[JetStreamConfig | None]):
             self.filter_text = event.value.strip()
             self._apply_filter()
             if not event.value.strip():
-                self.query_one("#filter-container").remove_class("visible")
-            self.query_one("#streams-table", DataTable).focus()
+                self._filter_container.remove_class("visible")
+            self._table.focus()
 
     def _apply_filter(self) -> None:
         """Apply filter to the streams table."""
-        table = self.query_one("#streams-table", DataTable)
+        table = self._table
         table.clear()
         self.filtered_streams = []
 
         filter_lower = self.filter_text.lower()
-        for stream in self.streams:
-            name = stream.config.name or "?"
-            if filter_lower and filter_lower not in name.lower():
+        rows: list[tuple[str, ...]] = []
+        for name_lower, row, stream in self._stream_rows:
+            if filter_lower and filter_lower not in name_lower:
                 continue
-
             self.filtered_streams.append(stream)
-            msgs = stream.state.messages
-            bytes_size = format_bytes(stream.state.bytes)
-            subjects = len(stream.config.subjects or [])
-            consumers = stream.state.consumer_count
-
-            table.add_row(
-                name,
-                f"{msgs:,}",
-                bytes_size,
-                str(subjects),
-                str(consumers),
-            )
+            rows.append(row)
+
+        table.add_rows(rows)
 
     def action_cancel(self) -> None:
         """Cancel and close the browser."""
         self.dismiss(None)
 
     def action_cursor_down(self) -> None:
-        self.query_one("#streams-table", DataTable).action_cursor_down()
+        self._table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        self.query_one("#streams-table", DataTable).action_cursor_up()
+        self._table.action_cursor_up()
 
     def action_cursor_top(self) -> None:
-        table = self.query_one("#streams-table", DataTable)
-        table.move_cursor(row=0)
+        self._table.move_cursor(row=0)
 
     def action_cursor_bottom(self) -> None:
-        table = self.query_one("#streams-table", DataTable)
         if self.filtered_streams:
-            table.move_cursor(row=len(self.filtered_streams) - 1)
+            self._table.move_cursor(row=len(self.filtered_streams) - 1)
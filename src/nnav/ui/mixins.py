@@ -1,19 +1,26 @@
 """Shared mixins and bindings for nnav UI."""
 
-from typing import Any
+import sys
+from functools import partial
+from typing import Any, Final
 
 from textual.binding import Binding
 from textual.widgets import DataTable
 
 from nnav.ui.widgets import FilterInput
+from nnav.utils.clipboard import copy_to_clipboard, prefer_terminal_clipboard
+
+# CSS classes toggled by the mixins
+FULLSCREEN_CLASS: Final[str] = sys.intern("fullscreen")
+FILTER_VISIBLE_CLASS: Final[str] = sys.intern("visible")
 
 # Common vim-style cursor navigation bindings
-CURSOR_BINDINGS: list[Binding] = [
+CURSOR_BINDINGS: tuple[Binding, ...] = (
     Binding("j", "cursor_down", "Down", show=False),
     Binding("k", "cursor_up", "Up", show=False),
     Binding("g", "cursor_top", "Top", show=False),
     Binding("G", "cursor_bottom", "Bottom", show=False),
-]
+)
 
 # Fullscreen toggle binding
 FULLSCREEN_BINDING = Binding("F", "toggle_fullscreen", "Fullscreen")
@@ -23,18 +30,51 @@ class FullscreenMixin:
     """Mixin providing fullscreen toggle functionality.
 
     Requires the app to have FULLSCREEN_CSS in its CSS and
-    FULLSCREEN_BINDING in its BINDINGS.
+    FULLSCREEN_BINDING in its BINDINGS. The "fullscreen" CSS class is
+    the only fullscreen state; check it with has_class("fullscreen").
     """
 
-    _fullscreen: bool = False
+    # Empty slots keep the mixin from adding a __dict__ of its own. Named
+    # slots on both mixins would be an instance layout conflict when they
+    # are combined, and Textual's App/Screen instances have a __dict__.
+    __slots__ = ()
 
     def action_toggle_fullscreen(self: Any) -> None:
         """Toggle fullscreen mode (hide header/footer/status bar)."""
-        self._fullscreen = not self._fullscreen
-        if self._fullscreen:
-            self.add_class("fullscreen")
+        self.toggle_class(FULLSCREEN_CLASS)
+
+
+class ClipboardMixin:
+    """Mixin copying text to the system clipboard without blocking the UI.
+
+    Over SSH, or without a clipboard command, text is sent to the
+    terminal as an OSC 52 escape through the app's driver. Otherwise the
+    clipboard command runs in a thread worker and reports back on the UI
+    thread.
+    """
+
+    __slots__ = ()
+
+    def _copy_text(self: Any, text: str, success: str) -> None:
+        """Copy text without blocking, then notify."""
+        if prefer_terminal_clipboard():
+            # No subprocess; success can't be confirmed, terminal support varies
+            self.app.copy_to_clipboard(text)
+            self.notify(success)
+            return
+        self.run_worker(
+            partial(self._copy_text_in_thread, text, success),
+            thread=True,
+            group="clipboard",
+        )
+
+    def _copy_text_in_thread(self: Any, text: str, success: str) -> None:
+        if copy_to_clipboard(text):
+            self.app.call_from_thread(self.notify, success)
         else:
-            self.remove_class("fullscreen")
+            self.app.call_from_thread(
+                self.notify, "Clipboard not available", severity="warning"
+            )
 
 
 class FilterMixin:
@@ -42,25 +82,53 @@ class FilterMixin:
 
     Requires:
     - FilterInput widget with id="filter" in compose()
+    - DataTable widget with id="table" in compose()
     - filter_text: str attribute on the class
     """
 
+    __slots__ = ()
+
     filter_text: str
+    _filter_input_cache: FilterInput | None = None
+    _table_cache: DataTable[Any] | None = None
+    _filter_visible: bool = False
+
+    def _get_filter_input(self: Any) -> FilterInput:
+        """Get the filter input, querying the DOM only on first use."""
+        filter_input: FilterInput | None = self._filter_input_cache
+        if filter_input is None:
+            filter_input = self._filter_input_cache = self.query_one(
+                "#filter", FilterInput
+            )
+        return filter_input
+
+    def _get_table(self: Any) -> DataTable[Any]:
+        """Get the data table, querying the DOM only on first use."""
+        table: DataTable[Any] | None = self._table_cache
+        if table is None:
+            table = self._table_cache = self.query_one("#table", DataTable)
+        return table
 
     def action_start_filter(self: Any) -> None:
         """Show filter input and focus it."""
-        filter_input = self.query_one("#filter", FilterInput)
-        filter_input.add_class("visible")
-        filter_input.value = self.filter_text
+        filter_input = self._get_filter_input()
+        filter_input.add_class(FILTER_VISIBLE_CLASS)
+        self._filter_visible = True
+        # Assigning value fires Input's watchers even when nothing changed
+        if filter_input.value != self.filter_text:
+            filter_input.value = self.filter_text
         filter_input.focus()
 
     def _hide_filter_input(self: Any) -> None:
         """Hide filter input and clear its value."""
-        filter_input = self.query_one("#filter", FilterInput)
-        if filter_input.has_class("visible"):
-            filter_input.remove_class("visible")
+        if not self._filter_visible:
+            return
+        filter_input = self._get_filter_input()
+        with self.app.batch_update():
+            filter_input.remove_class(FILTER_VISIBLE_CLASS)
             filter_input.value = ""
+        self._filter_visible = False
 
     def _focus_table(self: Any) -> None:
         """Focus the data table."""
-        self.query_one(DataTable).focus()
+        self._get_table().focus()
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
-import re
-from dataclasses import dataclass
+import os
+import signal
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rich.markup import escape as rich_escape
+from rich.console import RenderableType
 from rich.syntax import Syntax
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
+from textual.content import Content
 from textual.screen import ModalScreen
 from textual.widgets import (
     Button,
@@ -28,13 +33,38 @@ from textual.widgets import (
 )
 from textual.widgets.tree import TreeNode
 
+from nnav.constants import PIPE_OUTPUT_LIMIT
+from nnav.messages import write_json, write_ndjson
 from nnav.nats_client import MessageType, NatsMessage
-from nnav.utils.clipboard import copy_to_clipboard
+from nnav.ui.mixins import ClipboardMixin
+from nnav.utils.formatting import format_timestamp, pretty_json
 
 if TYPE_CHECKING:
     from nnav.nats_client import NatsSubscriber
 
 
+# First characters a JSON document can start with; json.loads also accepts
+# the non-standard NaN, Infinity and -Infinity literals
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _may_be_json(text: str) -> bool:
+    """Cheaply rule out text that cannot be JSON before trying to parse it."""
+    head = text[:32].lstrip() or text.lstrip()
+    return head[:1] in _JSON_START_CHARS
+
+
+@lru_cache(maxsize=32)
+def _make_syntax(formatted: str, theme: str) -> Syntax:
+    """Build a JSON Syntax block, sharing it between identical displays."""
+    return Syntax(formatted, "json", theme=theme, line_numbers=False)
+
+
+def _is_pretty_printed(payload: str) -> bool:
+    """Cheaply check whether a JSON payload is already laid out with indents."""
+    return payload.lstrip().startswith(("{\n", "[\n")) and "\n  " in payload[:200]
+
+
 @dataclass
 class StoredMessage:
     """Message stored with row key for retrieval."""
@@ -44,6 +74,95 @@ class StoredMessage:
     bookmarked: bool = False
     related_index: int | None = None  # Index of matching request/response
     imported: bool = False  # True for messages loaded from file
+    # Parsed payload; _is_json stays None until the payload is first parsed
+    _parsed: object = field(default=None, init=False, repr=False)
+    _is_json: bool | None = field(default=None, init=False, repr=False)
+    # Rendering caches, filled the first time the payload is shown as JSON
+    _formatted_json: str | None = field(default=None, init=False, repr=False)
+    _syntax_cache: Syntax | None = field(default=None, init=False, repr=False)
+    _syntax_theme: str | None = field(default=None, init=False, repr=False)
+    _payload_text: Text | None = field(default=None, init=False, repr=False)
+    _metadata_cache: Content | None = field(default=None, init=False, repr=False)
+    _metadata_key: tuple[bool, bool] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    @property
+    def is_json(self) -> bool:
+        """Whether the payload parses as JSON."""
+        self.parsed_json()
+        return bool(self._is_json)
+
+    def parsed_json(self) -> object:
+        """Get the payload parsed as JSON (None if it isn't JSON), parsing once."""
+        if self._is_json is None:
+            self._is_json = False
+            if _may_be_json(self.msg.payload):
+                try:
+                    self._parsed = json.loads(self.msg.payload)
+                    self._is_json = True
+                except json.JSONDecodeError:
+                    pass
+        return self._parsed
+
+    def formatted_payload(self) -> str:
+        """Get the payload pretty-printed if it is JSON, otherwise as-is."""
+        if not self.is_json:
+            return self.msg.payload
+        if self._formatted_json is None:
+            self._formatted_json = pretty_json(self._parsed)
+        return self._formatted_json
+
+    def _display_json(self) -> str:
+        """Get the JSON text to highlight, skipping re-formatting if indented."""
+        payload = self.msg.payload
+        if _is_pretty_printed(payload):
+            return payload.strip()
+        return self.formatted_payload()
+
+    def payload_text(self) -> Text:
+        """Get the raw payload as plain (never markup-parsed) text, building it once."""
+        if self._payload_text is None:
+            self._payload_text = Text(self.msg.payload)
+        return self._payload_text
+
+    def json_syntax(self, theme: str) -> Syntax:
+        """Get the highlighted, pretty-printed JSON payload, building it once."""
+        if self._syntax_cache is None or self._syntax_theme != theme:
+            self._syntax_cache = _make_syntax(self._display_json(), theme)
+            self._syntax_theme = theme
+        return self._syntax_cache
+
+    def metadata_content(self, fullscreen: bool) -> Content:
+        """Get the detail screen's metadata block, building it once."""
+        # The "press r" hints depend on whether a related message is known yet
+        key = (fullscreen, self.related_index is not None)
+        if self._metadata_cache is None or self._metadata_key != key:
+            self._metadata_cache = self._build_metadata(*key)
+            self._metadata_key = key
+        return self._metadata_cache
+
+    def _build_metadata(self, fullscreen: bool, has_related: bool) -> Content:
+        msg = self.msg
+        show_related = has_related and not fullscreen
+        rows: list[str | tuple[str, str]] = [
+            f"Time: {format_timestamp(msg.timestamp)}"
+        ]
+        if msg.reply_to:
+            rows.append((f"Reply-To: {msg.reply_to}", "$warning"))
+            if show_related:
+                rows.append(("  → Press 'r' to view response", "$success"))
+        if msg.request_subject:
+            rows.append(f"Request Subject: {msg.request_subject}")
+            if show_related:
+                rows.append(("  → Press 'r' to view original request", "$success"))
+        if msg.latency_ms is not None:
+            rows.append((f"Response Latency: {msg.latency_ms:.2f}ms", "$success"))
+        if msg.headers:
+            # Plain string parts are never parsed as markup, so no escaping
+            rows.extend(f"{k}: {v}" for k, v in msg.headers.items())
+        rows.append(f"Payload Size: {msg.payload_size} bytes")
+        return Content("\n").join(Content.assemble(row) for row in rows)
 
 
 @dataclass
@@ -54,6 +173,208 @@ class SubjectNode:
     full_subject: str
     count: int
     children: dict[str, SubjectNode]
+    # flatten() result; reset on every node along an insert's path
+    _flat_cache: list[tuple[str, int]] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def insert(self, subject: str) -> None:
+        """Count one message on subject, creating nodes as needed."""
+        parts = subject.split(".")
+        current = self
+        current._flat_cache = None
+        for i, part in enumerate(parts):
+            child = current.children.get(part)
+            if child is None:
+                full_subject = ".".join(parts[: i + 1])
+                child = current.children[part] = SubjectNode(
+                    name=part, full_subject=full_subject, count=0, children={}
+                )
+            current = child
+            current._flat_cache = None
+
+        # Increment count at leaf
+        current.count += 1
+
+    def flatten(self) -> list[tuple[str, int]]:
+        """List (subject, count) for nodes with messages, in pre-order.
+
+        The result is cached until the next insert below this node, and
+        must not be modified.
+        """
+        if self._flat_cache is None:
+            results: list[tuple[str, int]] = []
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if node.count > 0:
+                    results.append((node.full_subject, node.count))
+                # Reversed so children are visited in insertion order
+                stack.extend(reversed(node.children.values()))
+            self._flat_cache = results
+        return self._flat_cache
+
+
+_PIPE_READ_SIZE = 64 * 1024
+
+
+async def _feed_stdin(stdin: asyncio.StreamWriter, data: bytes) -> None:
+    """Write data to a subprocess's stdin and close it."""
+    try:
+        stdin.write(data)
+        await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # Command exited without reading all of its input
+    finally:
+        stdin.close()
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader, limit: int, drain: bool = False
+) -> tuple[bytes, bool]:
+    """Read a stream in chunks, stopping once more than limit bytes arrive.
+
+    With drain, reading carries on to EOF past the limit, discarding the
+    rest, so a writer is never blocked on a full pipe.
+
+    Returns the (at most limit) bytes read and whether output was cut off.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := await stream.read(_PIPE_READ_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            if drain:
+                while await stream.read(_PIPE_READ_SIZE):
+                    pass
+            return b"".join(chunks)[:limit], True
+    return b"".join(chunks), False
+
+
+def _iter_path_tokens(path: str) -> Iterator[str | int]:
+    """Split a JSON path query into keys (str) and list indexes (int).
+
+    Accepts an optional leading "$" and/or ".", e.g. "$.items[0].name".
+    """
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:]
+    if path.startswith("."):
+        path = path[1:]
+
+    i = 0
+    end = len(path)
+    while i < end:
+        char = path[i]
+        if char == ".":
+            i += 1
+        elif char == "[":
+            close = path.find("]", i)
+            if close == -1:
+                raise ValueError(f"Unclosed '[' in path '{path}'")
+            index = path[i + 1 : close]
+            if not (index.isascii() and index.isdigit()):
+                raise ValueError(f"Invalid index [{index}]")
+            yield int(index)
+            i = close + 1
+        elif char == "]":
+            raise ValueError(f"Unexpected ']' in path '{path}'")
+        else:
+            start = i
+            while i < end and path[i] not in ".[]":
+                i += 1
+            yield path[start:i]
+
+
+@lru_cache(maxsize=64)
+def _parse_path(path: str) -> tuple[str | int, ...]:
+    """Tokenize a JSON path query, reusing the tokens of recent queries."""
+    return tuple(_iter_path_tokens(path))
+
+
+# Help screen contents: (section title, rows)
+_HELP_SECTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "Navigation",
+        (
+            "  j / ↓      Move down",
+            "  k / ↑      Move up",
+            "  g          Go to first message",
+            "  G          Go to last message",
+            "  ctrl+d     Page down",
+            "  ctrl+u     Page up",
+            "  Enter      View message details",
+            "  n          Next bookmarked message",
+            "  N          Previous bookmarked message",
+        ),
+    ),
+    (
+        "Filtering & Search",
+        (
+            "  /          Filter messages (text, /regex/, !exclude)",
+            "             !pattern excludes matching messages",
+            "             orders.* and orders.> match subject wildcards",
+            "  Escape     Clear filter",
+            "  t          Filter by message type (REQ/RES/PUB)",
+        ),
+    ),
+    (
+        "Actions",
+        (
+            "  p          Pause/Resume stream",
+            "  c          Clear all messages",
+            "  m          Toggle bookmark on message",
+            "  y          Copy payload to clipboard",
+            "  Y          Copy subject to clipboard",
+            "  r          Republish selected message",
+            "  d          Diff two bookmarked messages",
+        ),
+    ),
+    (
+        "Export",
+        (
+            "  e          Export messages to JSON",
+            "  E          Export filtered messages",
+        ),
+    ),
+    (
+        "Views & Panels",
+        (
+            "  T          Subject tree browser",
+            "  F          Toggle fullscreen",
+            "  i          Show connection info",
+            "  ?          Show this help",
+            "  q          Quit",
+        ),
+    ),
+    (
+        "In Message Detail View",
+        (
+            "  j / k      Scroll down / up",
+            "  g / G      Scroll to top / bottom",
+            "  /          JSON path query",
+            "  :          Pipe to shell command",
+            "  r          Jump to related request/response",
+            "  y / Y      Copy payload / subject",
+        ),
+    ),
+)
+
+
+def _build_help_text() -> Text:
+    """Render the help sections into a single Text block."""
+    text = Text()
+    for section, rows in _HELP_SECTIONS:
+        # Blank line above every section title
+        text.append("\n\n" if text else "\n")
+        text.append(section, style="bold")
+        for row in rows:
+            text.append(f"\n  {row}")
+    return text
+
+
+_HELP_TEXT = _build_help_text()
 
 
 class HelpScreen(ModalScreen[None]):
@@ -85,16 +406,6 @@ class HelpScreen(ModalScreen[None]):
         padding-bottom: 1;
     }
 
-    .help-section {
-        padding-top: 1;
-        color: $primary;
-        text-style: bold;
-    }
-
-    .help-row {
-        padding-left: 2;
-    }
-
     #help-hint {
         text-align: center;
         color: $text-muted;
@@ -105,62 +416,19 @@ class HelpScreen(ModalScreen[None]):
     def compose(self) -> ComposeResult:
         with Container(id="help-dialog"):
             yield Label("nnav - Keyboard Shortcuts", id="help-title")
+            yield Static(_HELP_TEXT, id="help-text")
+            yield Label("Press any key to close", id="help-hint")
 
-            yield Label("Navigation", classes="help-section")
-            yield Label("  j / ↓      Move down", classes="help-row")
-            yield Label("  k / ↑      Move up", classes="help-row")
-            yield Label("  g          Go to first message", classes="help-row")
-            yield Label("  G          Go to last message", classes="help-row")
-            yield Label("  ctrl+d     Page down", classes="help-row")
-            yield Label("  ctrl+u     Page up", classes="help-row")
-            yield Label("  Enter      View message details", classes="help-row")
-            yield Label("  n          Next bookmarked message", classes="help-row")
-            yield Label("  N          Previous bookmarked message", classes="help-row")
-
-            yield Label("Filtering & Search", classes="help-section")
-            yield Label(
-                "  /          Filter messages (text, /regex/, !exclude)", classes="help-row"
-            )
-            yield Label("             !pattern excludes matching messages", classes="help-row")
-            yield Label("  Escape     Clear filter", classes="help-row")
-            yield Label(
-                "  t          Filter by message type (REQ/RES/PUB)", classes="help-row"
-            )
-
-            yield Label("Actions", classes="help-section")
-            yield Label("  p          Pause/Resume stream", classes="help-row")
-            yield Label("  c          Clear all messages", classes="help-row")
-            yield Label("  m          Toggle bookmark on message", classes="help-row")
-            yield Label("  y          Copy payload to clipboard", classes="help-row")
-            yield Label("  Y          Copy subject to clipboard", classes="help-row")
-            yield Label("  r          Republish selected message", classes="help-row")
-            yield Label("  d          Diff two bookmarked messages", classes="help-row")
-
-            yield Label("Export", classes="help-section")
-            yield Label("  e          Export messages to JSON", classes="help-row")
-            yield Label("  E          Export filtered messages", classes="help-row")
-
-            yield Label("Views & Panels", classes="help-section")
-            yield Label("  T          Subject tree browser", classes="help-row")
-            yield Label("  F          Toggle fullscreen", classes="help-row")
-            yield Label("  i          Show connection info", classes="help-row")
-            yield Label("  ?          Show this help", classes="help-row")
-            yield Label("  q          Quit", classes="help-row")
-
-            yield Label("In Message Detail View", classes="help-section")
-            yield Label("  j / k      Scroll down / up", classes="help-row")
-            yield Label("  g / G      Scroll to top / bottom", classes="help-row")
-            yield Label("  /          JSON path query", classes="help-row")
-            yield Label("  :          Pipe to shell command", classes="help-row")
-            yield Label(
-                "  r          Jump to related request/response", classes="help-row"
-            )
-            yield Label("  y / Y      Copy payload / subject", classes="help-row")
 
-            yield Label("Press any key to close", id="help-hint")
+# Detail screen hints; "r" is only offered once a related message is known
+_DETAIL_HINT = "q: close | y: copy | /: query | :: pipe"
+_DETAIL_RELATED_HINTS = {
+    MessageType.REQUEST: _DETAIL_HINT + " | r: response",
+    MessageType.RESPONSE: _DETAIL_HINT + " | r: request",
+}
 
 
-class MessageDetailScreen(ModalScreen[int | None]):
+class MessageDetailScreen(ClipboardMixin, ModalScreen[int | None]):
     """Modal screen to display message details."""
 
     BINDINGS = [
@@ -204,18 +472,6 @@ class MessageDetailScreen(ModalScreen[int | None]):
         padding-bottom: 1;
     }
 
-    .meta-row {
-        height: auto;
-    }
-
-    .meta-latency {
-        color: $success;
-    }
-
-    .meta-request {
-        color: $warning;
-    }
-
     #payload-container {
         height: 1fr;
         overflow: auto;
@@ -299,13 +555,15 @@ class MessageDetailScreen(ModalScreen[int | None]):
         self.msg = stored.msg
         self.preview_theme = preview_theme
         self.fullscreen = fullscreen
-        self._parsed_json: dict[str, object] | list[object] | None = None
+        self._parsed_json: object = None
         self._is_json = False
         self._current_path: str | None = None
         self._current_result: object = None
+        self._last_query: tuple[str, object, RenderableType] | None = None
         # Pipe command state
         self._pipe_output: str | None = None
         self._pipe_command: str | None = None
+        self._pipe_input: tuple[str | None, bytes] | None = None  # (query, bytes)
         self._showing_transformed: bool = False
 
     def compose(self) -> ComposeResult:
@@ -317,45 +575,9 @@ class MessageDetailScreen(ModalScreen[int | None]):
                 id="title",
             )
 
-            with Vertical(id="metadata"):
-                yield Label(
-                    f"Time: {self.msg.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}",
-                    classes="meta-row",
-                )
-                if self.msg.reply_to:
-                    yield Label(
-                        f"Reply-To: {self.msg.reply_to}",
-                        classes="meta-row meta-request",
-                    )
-                    if self.stored.related_index is not None and not self.fullscreen:
-                        yield Label(
-                            "  → Press 'r' to view response",
-                            classes="meta-row meta-latency",
-                        )
-                if self.msg.request_subject:
-                    yield Label(
-                        f"Request Subject: {self.msg.request_subject}",
-                        classes="meta-row",
-                    )
-                    if self.stored.related_index is not None and not self.fullscreen:
-                        yield Label(
-                            "  → Press 'r' to view original request",
-                            classes="meta-row meta-latency",
-                        )
-                if self.msg.latency_ms is not None:
-                    yield Label(
-                        f"Response Latency: {self.msg.latency_ms:.2f}ms",
-                        classes="meta-row meta-latency",
-                    )
-                if self.msg.headers:
-                    for k, v in self.msg.headers.items():
-                        yield Label(
-                            f"{rich_escape(k)}: {rich_escape(str(v))}",
-                            classes="meta-row",
-                        )
-                yield Label(
-                    f"Payload Size: {len(self.msg.payload)} bytes", classes="meta-row"
-                )
+            yield Static(
+                self.stored.metadata_content(self.fullscreen), id="metadata"
+            )
 
             yield Label("", id="path-label")
             yield Label("", id="transform-label")
@@ -375,53 +597,51 @@ class MessageDetailScreen(ModalScreen[int | None]):
                     )
 
                 if not self.fullscreen:
-                    hint_parts = ["q: close", "y: copy", "/: query", ":: pipe"]
+                    hint = _DETAIL_HINT
                     if self.stored.related_index is not None:
-                        if self.msg.message_type == MessageType.REQUEST:
-                            hint_parts.append("r: response")
-                        elif self.msg.message_type == MessageType.RESPONSE:
-                            hint_parts.append("r: request")
-                    yield Label(" | ".join(hint_parts), id="hint")
+                        hint = _DETAIL_RELATED_HINTS.get(
+                            self.msg.message_type, _DETAIL_HINT
+                        )
+                    yield Label(hint, id="hint")
 
     def on_mount(self) -> None:
         """Format and display the payload with syntax highlighting."""
-        payload_widget = self.query_one("#payload", Static)
-        self._display_payload(payload_widget, self.msg.payload)
-
-    def _display_payload(self, widget: Static, payload: str) -> None:
+        self._payload_widget = self.query_one("#payload", Static)
+        self._payload_container = self.query_one(
+            "#payload-container", ScrollableContainer
+        )
+        self._path_label = self.query_one("#path-label", Label)
+        self._transform_label = self.query_one("#transform-label", Label)
+        self._json_container = self.query_one("#json-path-container")
+        self._json_input = self.query_one("#json-path-input", Input)
+        self._pipe_container = self.query_one("#pipe-command-container")
+        self._pipe_command_input = self.query_one("#pipe-command-input", Input)
+        self._display_payload(self._payload_widget)
+
+    def _display_payload(self, widget: Static) -> None:
         """Display payload with JSON syntax highlighting if applicable."""
-        try:
-            self._parsed_json = json.loads(payload)
-            self._is_json = True
-            formatted = json.dumps(self._parsed_json, indent=2)
-            syntax = Syntax(
-                formatted, "json", theme=self.preview_theme, line_numbers=False
-            )
-            widget.update(syntax)
-        except json.JSONDecodeError:
-            self._parsed_json = None
-            self._is_json = False
-            widget.update(payload)
+        self._parsed_json = self.stored.parsed_json()
+        self._is_json = self.stored.is_json
+        if self._is_json:
+            widget.update(self.stored.json_syntax(self.preview_theme))
+        else:
+            widget.update(self.stored.payload_text())
 
     def action_scroll_down(self) -> None:
         """Scroll payload down."""
-        container = self.query_one("#payload-container", ScrollableContainer)
-        container.scroll_relative(y=3)
+        self._payload_container.scroll_relative(y=3)
 
     def action_scroll_up(self) -> None:
         """Scroll payload up."""
-        container = self.query_one("#payload-container", ScrollableContainer)
-        container.scroll_relative(y=-3)
+        self._payload_container.scroll_relative(y=-3)
 
     def action_scroll_top(self) -> None:
         """Scroll to top."""
-        container = self.query_one("#payload-container", ScrollableContainer)
-        container.scroll_home()
+        self._payload_container.scroll_home()
 
     def action_scroll_bottom(self) -> None:
         """Scroll to bottom."""
-        container = self.query_one("#payload-container", ScrollableContainer)
-        container.scroll_end()
+        self._payload_container.scroll_end()
 
     def action_dismiss_none(self) -> None:
         """Dismiss without navigation."""
@@ -429,8 +649,8 @@ class MessageDetailScreen(ModalScreen[int | None]):
 
     def action_dismiss_or_reset(self) -> None:
         """Escape: reset transform/query or close."""
-        pipe_container = self.query_one("#pipe-command-container")
-        json_container = self.query_one("#json-path-container")
+        pipe_container = self._pipe_container
+        json_container = self._json_container
 
         if pipe_container.has_class("visible"):
             pipe_container.remove_class("visible")
@@ -446,9 +666,9 @@ class MessageDetailScreen(ModalScreen[int | None]):
 
     def action_focus_query_or_close(self) -> None:
         """Enter: focus query input if visible, otherwise close."""
-        container = self.query_one("#json-path-container")
+        container = self._json_container
         if container.has_class("visible"):
-            self.query_one("#json-path-input", Input).focus()
+            self._json_input.focus()
         else:
             self.dismiss(None)
 
@@ -465,27 +685,21 @@ class MessageDetailScreen(ModalScreen[int | None]):
     def action_copy_payload(self) -> None:
         """Copy payload to clipboard. Copies transform/query result if active."""
         if self._showing_transformed and self._pipe_output is not None:
-            copy_to_clipboard(self._pipe_output)
-            self.notify("Copied piped output")
+            self._copy_text(self._pipe_output, "Copied piped output")
         elif self._current_path is not None and self._current_result is not None:
             if isinstance(self._current_result, (dict, list)):
-                text = json.dumps(self._current_result, indent=2)
+                text = pretty_json(self._current_result)
             else:
                 text = str(self._current_result)
-            copy_to_clipboard(text)
-            self.notify(f"Copied: {self._current_path}")
-        elif self._is_json and self._parsed_json is not None:
-            text = json.dumps(self._parsed_json, indent=2)
-            copy_to_clipboard(text)
-            self.notify("Payload copied to clipboard")
+            self._copy_text(text, f"Copied: {self._current_path}")
         else:
-            copy_to_clipboard(self.msg.payload)
-            self.notify("Payload copied to clipboard")
+            self._copy_text(
+                self.stored.formatted_payload(), "Payload copied to clipboard"
+            )
 
     def action_copy_subject(self) -> None:
         """Copy subject to clipboard."""
-        copy_to_clipboard(self.msg.subject)
-        self.notify("Subject copied to clipboard")
+        self._copy_text(self.msg.subject, "Subject copied to clipboard")
 
     def action_extract_json_path(self) -> None:
         """Toggle JSON path input."""
@@ -493,11 +707,11 @@ class MessageDetailScreen(ModalScreen[int | None]):
             self.notify("Payload is not valid JSON", severity="warning")
             return
 
-        container = self.query_one("#json-path-container")
+        container = self._json_container
         container.toggle_class("visible")
 
         if container.has_class("visible"):
-            input_widget = self.query_one("#json-path-input", Input)
+            input_widget = self._json_input
             input_widget.value = self._current_path or ""
             input_widget.focus()
             input_widget.cursor_position = len(input_widget.value)
@@ -506,11 +720,9 @@ class MessageDetailScreen(ModalScreen[int | None]):
         """Reset the display to show the full payload."""
         self._current_path = None
         self._current_result = None
-        payload_widget = self.query_one("#payload", Static)
-        self._display_payload(payload_widget, self.msg.payload)
-        path_label = self.query_one("#path-label", Label)
-        path_label.update("")
-        path_label.remove_class("visible")
+        self._display_payload(self._payload_widget)
+        self._path_label.update("")
+        self._path_label.remove_class("visible")
         self.notify("Showing full payload")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -522,96 +734,86 @@ class MessageDetailScreen(ModalScreen[int | None]):
                 self.set_focus(None)
             else:
                 self._reset_to_full_payload()
-                self.query_one("#json-path-container").remove_class("visible")
+                self._json_container.remove_class("visible")
                 self.set_focus(None)
         elif event.input.id == "pipe-command-input":
             command = event.value.strip()
             if command:
                 self.run_worker(self._execute_pipe_command(command))
-                self.query_one("#pipe-command-container").remove_class("visible")
+                self._pipe_container.remove_class("visible")
                 self.set_focus(None)
             else:
-                self.query_one("#pipe-command-container").remove_class("visible")
+                self._pipe_container.remove_class("visible")
 
     def _execute_json_path(self, path: str) -> None:
         """Execute a JSON path query and show result in main payload panel."""
-        payload_widget = self.query_one("#payload", Static)
-        path_label = self.query_one("#path-label", Label)
+        payload_widget = self._payload_widget
+        path_label = self._path_label
 
         if self._parsed_json is None:
             self.notify("Payload is not valid JSON", severity="error")
             return
 
         try:
-            result = self._get_json_path(self._parsed_json, path)
+            # Re-running the previous query reuses its rendered result
+            if self._last_query is not None and self._last_query[0] == path:
+                _, result, rendered = self._last_query
+            else:
+                result = self._get_json_path(self._parsed_json, path)
+                rendered = self._render_query_result(result)
+                self._last_query = (path, result, rendered)
             self._current_path = path
             self._current_result = result
 
             path_label.update(f"Query: {path}")
             path_label.add_class("visible")
-
-            if isinstance(result, (dict, list)):
-                formatted = json.dumps(result, indent=2)
-                syntax = Syntax(
-                    formatted, "json", theme=self.preview_theme, line_numbers=False
-                )
-                payload_widget.update(syntax)
-            elif isinstance(result, str):
-                payload_widget.update(Text(f'"{result}"', style="green"))
-            else:
-                payload_widget.update(Text(str(result), style="cyan"))
+            payload_widget.update(rendered)
 
             self.notify(f"Showing: {path}")
         except Exception as e:
             self.notify(f"Error: {e}", severity="error")
 
+    def _render_query_result(self, result: object) -> RenderableType:
+        """Render a JSON path query result for the payload panel."""
+        if isinstance(result, (dict, list)):
+            return _make_syntax(pretty_json(result), self.preview_theme)
+        if isinstance(result, str):
+            return Text(f'"{result}"', style="green")
+        return Text(str(result), style="cyan")
+
     def _get_json_path(self, data: object, path: str) -> object:
         """Extract value at JSON path. Supports .key, [index], and combinations."""
-        path = path.strip()
-        if path.startswith("$"):
-            path = path[1:]
-        if path.startswith("."):
-            path = path[1:]
-
-        if not path:
-            return data
-
         current: object = data
-        tokens = re.findall(r"\.?([^.\[\]]+)|\[(\d+)\]", path)
-
-        for token in tokens:
-            key, index = token
-            if key:
-                if isinstance(current, dict):
-                    if key not in current:
-                        raise KeyError(f"Key '{key}' not found")
-                    current = current[key]
-                else:
+        for token in _parse_path(path):
+            # Keys are str and indexes int; keys are by far the common case
+            if isinstance(token, str):
+                if not isinstance(current, dict):
                     raise TypeError(
-                        f"Cannot access key '{key}' on {type(current).__name__}"
+                        f"Cannot access key '{token}' on {type(current).__name__}"
                     )
-            elif index:
-                idx = int(index)
-                if isinstance(current, list):
-                    if idx >= len(current) or idx < -len(current):
-                        raise IndexError(
-                            f"Index {idx} out of range (length {len(current)})"
-                        )
-                    current = current[idx]
-                else:
+                if token not in current:
+                    raise KeyError(f"Key '{token}' not found")
+                current = current[token]
+            else:
+                if not isinstance(current, list):
                     raise TypeError(
-                        f"Cannot access index [{idx}] on {type(current).__name__}"
+                        f"Cannot access index [{token}] on {type(current).__name__}"
                     )
+                if token >= len(current):
+                    raise IndexError(
+                        f"Index {token} out of range (length {len(current)})"
+                    )
+                current = current[token]
 
         return current
 
     def action_pipe_command(self) -> None:
         """Toggle pipe command input."""
-        container = self.query_one("#pipe-command-container")
+        container = self._pipe_container
         container.toggle_class("visible")
 
         if container.has_class("visible"):
-            input_widget = self.query_one("#pipe-command-input", Input)
+            input_widget = self._pipe_command_input
             input_widget.value = ""
             input_widget.focus()
 
@@ -619,15 +821,20 @@ class MessageDetailScreen(ModalScreen[int | None]):
         """Get content to pipe - query result if active, otherwise full payload."""
         if self._current_path is not None and self._current_result is not None:
             if isinstance(self._current_result, (dict, list)):
-                return json.dumps(self._current_result, indent=2)
+                return pretty_json(self._current_result)
             return str(self._current_result)
-        elif self._is_json and self._parsed_json is not None:
-            return json.dumps(self._parsed_json, indent=2)
-        return self.msg.payload
+        return self.stored.formatted_payload()
+
+    def _get_pipe_input(self) -> bytes:
+        """Get the pipeable content encoded, reusing it until the query changes."""
+        if self._pipe_input is None or self._pipe_input[0] != self._current_path:
+            content = self._get_pipeable_content().encode()
+            self._pipe_input = (self._current_path, content)
+        return self._pipe_input[1]
 
     async def _execute_pipe_command(self, command: str) -> None:
         """Execute shell command with payload as stdin."""
-        content = self._get_pipeable_content()
+        content = self._get_pipe_input()
 
         try:
             process = await asyncio.create_subprocess_shell(
@@ -635,11 +842,43 @@ class MessageDetailScreen(ModalScreen[int | None]):
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
             )
-            stdout, stderr = await process.communicate(content.encode())
+            stdin, stdout_stream, stderr_stream = (
+                process.stdin,
+                process.stdout,
+                process.stderr,
+            )
+            if stdin is None or stdout_stream is None or stderr_stream is None:
+                raise RuntimeError("subprocess pipes unavailable")
+
+            async def read_stdout() -> tuple[bytes, bool]:
+                output, truncated = await _read_capped(
+                    stdout_stream, PIPE_OUTPUT_LIMIT
+                )
+                if truncated:
+                    # Stop the whole pipeline rather than draining it; killing
+                    # only the shell would leave its children holding the pipes
+                    with contextlib.suppress(ProcessLookupError):
+                        os.killpg(process.pid, signal.SIGKILL)
+                return output, truncated
+
+            # Feed stdin while draining both outputs so neither side can stall;
+            # only the start of stderr is kept, the rest is read and dropped
+            _, (stdout, truncated), (stderr, _) = await asyncio.gather(
+                _feed_stdin(stdin, content),
+                read_stdout(),
+                _read_capped(stderr_stream, _PIPE_READ_SIZE, drain=True),
+            )
+            await process.wait()
 
             self._pipe_command = command
             self._pipe_output = stdout.decode("utf-8", errors="replace")
+            if truncated:
+                self.notify(
+                    f"Output truncated to {PIPE_OUTPUT_LIMIT // 1024} KiB",
+                    severity="warning",
+                )
 
             if stderr:
                 stderr_text = stderr.decode("utf-8", errors="replace").strip()
@@ -653,8 +892,8 @@ class MessageDetailScreen(ModalScreen[int | None]):
 
     def _display_pipe_result(self) -> None:
         """Display the piped command output."""
-        payload_widget = self.query_one("#payload", Static)
-        transform_label = self.query_one("#transform-label", Label)
+        payload_widget = self._payload_widget
+        transform_label = self._transform_label
 
         self._showing_transformed = True
         transform_label.update(f"Pipe: {self._pipe_command}")
@@ -662,16 +901,17 @@ class MessageDetailScreen(ModalScreen[int | None]):
 
         output = self._pipe_output or ""
 
+        if not _may_be_json(output):
+            payload_widget.update(Text(output))
+            return
+
         # Try to detect if output is JSON for syntax highlighting
         try:
             parsed = json.loads(output)
-            formatted = json.dumps(parsed, indent=2)
-            syntax = Syntax(
-                formatted, "json", theme=self.preview_theme, line_numbers=False
-            )
-            payload_widget.update(syntax)
+            formatted = pretty_json(parsed)
+            payload_widget.update(_make_syntax(formatted, self.preview_theme))
         except (json.JSONDecodeError, TypeError):
-            payload_widget.update(output)
+            payload_widget.update(Text(output))
 
     def _reset_from_transform(self) -> None:
         """Reset from transformed view back to original."""
@@ -679,15 +919,13 @@ class MessageDetailScreen(ModalScreen[int | None]):
         self._pipe_command = None
         self._showing_transformed = False
 
-        transform_label = self.query_one("#transform-label", Label)
-        transform_label.update("")
-        transform_label.remove_class("visible")
+        self._transform_label.update("")
+        self._transform_label.remove_class("visible")
 
-        payload_widget = self.query_one("#payload", Static)
         if self._current_path is not None:
             self._execute_json_path(self._current_path)
         else:
-            self._display_payload(payload_widget, self.msg.payload)
+            self._display_payload(self._payload_widget)
 
         self.notify("Showing original payload")
 
@@ -750,58 +988,52 @@ class DiffScreen(ModalScreen[None]):
     """
 
     def __init__(
-        self, msg1: NatsMessage, msg2: NatsMessage, preview_theme: str = "monokai"
+        self,
+        stored1: StoredMessage,
+        stored2: StoredMessage,
+        preview_theme: str = "monokai",
     ) -> None:
         super().__init__()
-        self.msg1 = msg1
-        self.msg2 = msg2
+        self.stored1 = stored1
+        self.stored2 = stored2
+        self.msg1 = stored1.msg
+        self.msg2 = stored2.msg
         self.preview_theme = preview_theme
 
+    @staticmethod
+    def _header(msg: NatsMessage) -> Content:
+        """Two-line pane header; plain Content so subjects are never markup."""
+        time_str = format_timestamp(msg.timestamp, with_date=False)
+        return Content(
+            f"[{msg.message_type.value}] {msg.subject}\nTime: {time_str}"
+        )
+
     def compose(self) -> ComposeResult:
         with Container(id="diff-dialog"):
             yield Label("Message Diff", id="diff-title")
 
             with Horizontal(id="diff-container"):
                 with Vertical(classes="diff-pane"):
-                    yield Label(
-                        f"[{self.msg1.message_type.value}] {self.msg1.subject}",
-                        classes="diff-header",
-                    )
-                    yield Label(
-                        f"Time: {self.msg1.timestamp.strftime('%H:%M:%S.%f')[:-3]}",
-                        classes="diff-header",
-                    )
+                    yield Static(self._header(self.msg1), classes="diff-header")
                     yield Static(id="diff-left", classes="diff-content")
 
                 with Vertical(classes="diff-pane"):
-                    yield Label(
-                        f"[{self.msg2.message_type.value}] {self.msg2.subject}",
-                        classes="diff-header",
-                    )
-                    yield Label(
-                        f"Time: {self.msg2.timestamp.strftime('%H:%M:%S.%f')[:-3]}",
-                        classes="diff-header",
-                    )
+                    yield Static(self._header(self.msg2), classes="diff-header")
                     yield Static(id="diff-right", classes="diff-content")
 
     def on_mount(self) -> None:
         """Display payloads with syntax highlighting."""
         left = self.query_one("#diff-left", Static)
         right = self.query_one("#diff-right", Static)
-        self._display_payload(left, self.msg1.payload)
-        self._display_payload(right, self.msg2.payload)
+        self._display_payload(left, self.stored1)
+        self._display_payload(right, self.stored2)
 
-    def _display_payload(self, widget: Static, payload: str) -> None:
+    def _display_payload(self, widget: Static, stored: StoredMessage) -> None:
         """Display payload with syntax highlighting if JSON."""
-        try:
-            parsed = json.loads(payload)
-            formatted = json.dumps(parsed, indent=2)
-            syntax = Syntax(
-                formatted, "json", theme=self.preview_theme, line_numbers=False
-            )
-            widget.update(syntax)
-        except json.JSONDecodeError:
-            widget.update(payload)
+        if stored.is_json:
+            widget.update(stored.json_syntax(self.preview_theme))
+        else:
+            widget.update(stored.payload_text())
 
 
 class PublishScreen(ModalScreen[None]):
@@ -1011,6 +1243,23 @@ class ExportScreen(ModalScreen[None]):
                 yield Button("Export NDJSON", variant="default", id="ndjson-btn")
                 yield Button("Cancel", variant="default", id="cancel-btn")
 
+    @staticmethod
+    def _export_row(stored: StoredMessage) -> dict[str, object]:
+        """Exported fields of one message."""
+        msg = stored.msg
+        return {
+            "timestamp": msg.timestamp.isoformat(),
+            "type": msg.message_type.value,
+            "subject": msg.subject,
+            "payload": msg.payload,
+            "reply_to": msg.reply_to,
+            "headers": msg.headers,
+            "latency_ms": msg.latency_ms,
+            "request_subject": msg.request_subject,
+            "payload_size": msg.payload_size,
+            "bookmarked": stored.bookmarked,
+        }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "cancel-btn":
@@ -1021,30 +1270,13 @@ class ExportScreen(ModalScreen[None]):
         path = Path(path_str).expanduser()
 
         try:
-            messages_data = [
-                {
-                    "timestamp": stored.msg.timestamp.isoformat(),
-                    "type": stored.msg.message_type.value,
-                    "subject": stored.msg.subject,
-                    "payload": stored.msg.payload,
-                    "reply_to": stored.msg.reply_to,
-                    "headers": stored.msg.headers,
-                    "latency_ms": stored.msg.latency_ms,
-                    "request_subject": stored.msg.request_subject,
-                    "bookmarked": stored.bookmarked,
-                }
-                for stored in self.messages
-            ]
-
             if event.button.id == "json-btn":
-                with path.open("w") as f:
-                    json.dump(messages_data, f, indent=2)
+                write_json(path, [self._export_row(s) for s in self.messages])
             elif event.button.id == "ndjson-btn":
-                with path.open("w") as f:
-                    for msg in messages_data:
-                        f.write(json.dumps(msg) + "\n")
+                # Rows are built as they are written, never held all at once
+                write_ndjson(path, map(self._export_row, self.messages))
 
-            self.notify(f"Exported {len(messages_data)} messages to {path}")
+            self.notify(f"Exported {len(self.messages)} messages to {path}")
             self.dismiss()
 
         except Exception as e:
@@ -1128,6 +1360,13 @@ class ConnectionInfoScreen(ModalScreen[None]):
                 yield Label(f"User: {self.subscriber.user}", classes="info-row")
 
 
+# Every possible histogram bar, indexed by filled length
+_HISTOGRAM_WIDTH = 25
+_HISTOGRAM_BARS = tuple(
+    "█" * i + "░" * (_HISTOGRAM_WIDTH - i) for i in range(_HISTOGRAM_WIDTH + 1)
+)
+
+
 class SubjectTreeScreen(ModalScreen[str | None]):
     """Screen showing hierarchical subject tree."""
 
@@ -1193,6 +1432,10 @@ class SubjectTreeScreen(ModalScreen[str | None]):
         self.histogram_mode = False
         self.sort_by_count = True
         self._flat_subjects: list[tuple[str, int]] = []
+        # Both histogram orders, sorted once since the tree is fixed while open
+        self._by_count: list[tuple[str, int]] = []
+        self._by_name: list[tuple[str, int]] = []
+        self._max_count = 0
 
     def compose(self) -> ComposeResult:
         with Container(id="tree-dialog"):
@@ -1208,10 +1451,10 @@ class SubjectTreeScreen(ModalScreen[str | None]):
 
         self._populate_tree(tree.root, self.root)
 
-        for child in tree.root.children:
-            child.expand()
-
-        self._flat_subjects = self._build_flat_subjects()
+        self._flat_subjects = self.root.flatten()
+        self._by_count = sorted(self._flat_subjects, key=lambda x: -x[1])
+        self._by_name = sorted(self._flat_subjects, key=lambda x: x[0])
+        self._max_count = self._by_count[0][1] if self._by_count else 0
 
         table = self.query_one("#histogram-table", DataTable)
         table.add_columns("Subject", "Distribution", "Count")
@@ -1220,19 +1463,25 @@ class SubjectTreeScreen(ModalScreen[str | None]):
     def _populate_tree(
         self, tree_node: TreeNode[str], subject_node: SubjectNode
     ) -> None:
-        """Recursively add children to the tree."""
-        for name in sorted(subject_node.children.keys()):
-            child = subject_node.children[name]
-            if child.count > 0:
-                label = f"{name} ({child.count})"
-            else:
-                label = name
+        """Add all descendants of subject_node under tree_node."""
+        # Explicit stack: deep subject hierarchies can't hit the recursion limit
+        stack = [(tree_node, subject_node)]
+        while stack:
+            tree_node, subject_node = stack.pop()
+            add, add_leaf = tree_node.add, tree_node.add_leaf
+            # Top-level subjects start expanded, set as they are created
+            expand = tree_node.is_root
+            for name, child in sorted(subject_node.children.items()):
+                if child.count > 0:
+                    label = f"{name} ({child.count})"
+                else:
+                    label = name
 
-            if child.children:
-                new_node = tree_node.add(label, data=child.full_subject)
-                self._populate_tree(new_node, child)
-            else:
-                tree_node.add_leaf(label, data=child.full_subject)
+                if child.children:
+                    new_node = add(label, data=child.full_subject, expand=expand)
+                    stack.append((new_node, child))
+                else:
+                    add_leaf(label, data=child.full_subject)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected[str]) -> None:
         """Handle node selection - set filter to that subject."""
@@ -1260,40 +1509,23 @@ class SubjectTreeScreen(ModalScreen[str | None]):
         else:
             self.query_one("#subject-tree", Tree).action_cursor_up()
 
-    def _build_flat_subjects(self) -> list[tuple[str, int]]:
-        """Flatten tree to list of (subject, count) tuples."""
-        results: list[tuple[str, int]] = []
-
-        def walk(node: SubjectNode) -> None:
-            if node.count > 0:
-                results.append((node.full_subject, node.count))
-            for child in node.children.values():
-                walk(child)
-
-        walk(self.root)
-        return results
-
     def _populate_histogram(self) -> None:
         """Populate the histogram table."""
         table = self.query_one("#histogram-table", DataTable)
-        table.clear()
-
-        subjects = self._flat_subjects
-        if self.sort_by_count:
-            subjects = sorted(subjects, key=lambda x: -x[1])
-        else:
-            subjects = sorted(subjects, key=lambda x: x[0])
-
-        if not subjects:
-            return
-
-        max_count = max(c for _, c in subjects)
-        bar_width = 25
-
-        for subject, count in subjects:
-            bar_len = int((count / max_count) * bar_width) if max_count > 0 else 0
-            bar = "█" * bar_len + "░" * (bar_width - bar_len)
-            table.add_row(subject, bar, str(count), key=subject)
+        subjects = self._by_count if self.sort_by_count else self._by_name
+        max_count = self._max_count
+
+        # Rows need keys for selection, so add them one by one but let the
+        # screen update once for the whole table
+        with self.app.batch_update():
+            table.clear()
+            for subject, count in subjects:
+                bar_len = (
+                    int((count / max_count) * _HISTOGRAM_WIDTH) if max_count > 0 else 0
+                )
+                table.add_row(
+                    subject, _HISTOGRAM_BARS[bar_len], str(count), key=subject
+                )
 
     def action_toggle_histogram(self) -> None:
         """Toggle between tree and histogram view."""
@@ -1,8 +1,12 @@
 """Shared widgets for nnav UI."""
 
+from collections import deque
+
 from textual.events import Key
 from textual.widgets import Input
 
+from nnav.constants import FILTER_HISTORY_SIZE
+
 
 class FilterInput(Input):
     """Input widget for filtering with visibility toggle and history.
@@ -24,14 +28,17 @@ class FilterInput(Input):
 
     def __init__(self, *args: object, **kwargs: object) -> None:
         super().__init__(*args, **kwargs)  # type: ignore[arg-type]
-        self._history: list[str] = []
+        self._history: deque[str] = deque(maxlen=FILTER_HISTORY_SIZE)
+        self._seen: set[str] = set()
         self._history_index: int = -1
         self._current_input: str = ""
 
     def set_history(self, history: list[str]) -> None:
         """Set the filter history list."""
-        self._history = history
-        self._history_index = -1
+        self._history.clear()
+        self._seen.clear()
+        for text in history:
+            self.add_to_history(text)
 
     def add_to_history(self, text: str) -> None:
         """Add a filter to history (dedupe, most recent last)."""
@@ -39,17 +46,18 @@ class FilterInput(Input):
         if not text:
             return
         # Remove if already exists to avoid duplicates
-        if text in self._history:
+        if text in self._seen:
             self._history.remove(text)
+        elif len(self._history) == self._history.maxlen:
+            # The append below evicts the oldest entry
+            self._seen.discard(self._history[0])
         self._history.append(text)
-        # Limit history size
-        if len(self._history) > 50:
-            self._history = self._history[-50:]
+        self._seen.add(text)
         self._history_index = -1
 
     def get_history(self) -> list[str]:
         """Get the current history list."""
-        return self._history.copy()
+        return list(self._history)
 
     def on_key(self, event: Key) -> None:
         """Handle up/down arrow keys for history navigation."""
@@ -1,11 +1,21 @@
 """Utility functions for nnav."""
 
-from nnav.utils.clipboard import copy_to_clipboard
-from nnav.utils.formatting import format_bytes
-from nnav.utils.patterns import matches_nats_pattern
+from nnav.utils.clipboard import copy_to_clipboard, prefer_terminal_clipboard
+from nnav.utils.formatting import (
+    encode_json,
+    format_bytes,
+    format_timestamp,
+    pretty_json,
+)
+from nnav.utils.patterns import is_nats_pattern, matches_nats_pattern
 
 __all__ = [
     "copy_to_clipboard",
+    "encode_json",
     "format_bytes",
+    "format_timestamp",
+    "is_nats_pattern",
     "matches_nats_pattern",
+    "prefer_terminal_clipboard",
+    "pretty_json",
 ]
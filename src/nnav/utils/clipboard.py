@@ -1,12 +1,51 @@
 """Clipboard utilities for nnav."""
 
+import os
+import shutil
 import subprocess
+from functools import cache
+
+# Clipboard commands in order of preference: macOS, X11, Wayland
+_CLIPBOARD_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("pbcopy",),
+    ("xclip", "-selection", "clipboard"),
+    ("wl-copy",),
+)
+
+# Set when running over SSH, where a local clipboard command would reach the
+# wrong machine but the terminal itself can receive an OSC 52 clipboard
+# escape. TMUX is deliberately absent: tmux may ignore OSC 52 from
+# applications (set-clipboard external), while local commands still work.
+_REMOTE_SESSION_VARS = ("SSH_TTY", "SSH_CONNECTION")
+
+
+@cache
+def _clipboard_command() -> tuple[str, ...] | None:
+    """Find the first available clipboard command, looking it up only once."""
+    for command in _CLIPBOARD_COMMANDS:
+        if shutil.which(command[0]):
+            return command
+    return None
+
+
+def prefer_terminal_clipboard() -> bool:
+    """Whether to copy through the terminal (OSC 52) rather than a command.
+
+    True in SSH sessions and when no clipboard command is installed.
+
+    Returns:
+        True if the terminal's OSC 52 clipboard should be used
+    """
+    if any(var in os.environ for var in _REMOTE_SESSION_VARS):
+        return True
+    return _clipboard_command() is None
 
 
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to system clipboard.
 
-    Tries pbcopy (macOS) first, then xclip (Linux).
+    Uses pbcopy (macOS), xclip (X11) or wl-copy (Wayland), whichever is
+    found first on PATH.
 
     Args:
         text: Text to copy to clipboard
@@ -14,22 +53,11 @@ def copy_to_clipboard(text: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    # Try macOS pbcopy first
-    try:
-        subprocess.run(["pbcopy"], input=text.encode(), check=True)
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-
-    # Try Linux xclip
+    command = _clipboard_command()
+    if command is None:
+        return False
     try:
-        subprocess.run(
-            ["xclip", "-selection", "clipboard"],
-            input=text.encode(),
-            check=True,
-        )
+        subprocess.run(command, input=text.encode(), check=True)
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-
-    return False
+        return False
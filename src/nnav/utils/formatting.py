@@ -1,5 +1,10 @@
 """Formatting utilities for nnav."""
 
+import json
+from datetime import datetime
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def format_bytes(num_bytes: int) -> str:
     """Format bytes to human readable string.
@@ -10,9 +15,54 @@ def format_bytes(num_bytes: int) -> str:
     Returns:
         Human readable string like "1.5 MB" or "256 KB"
     """
-    size = float(num_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    if num_bytes < 1024:
+        return f"{float(num_bytes):.1f} B"
+    # Each unit is 2**10 times the previous one, so the bit length gives it
+    exp = min((num_bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{num_bytes / (1 << (exp * 10)):.1f} {_BYTE_UNITS[exp]}"
+
+
+def format_timestamp(ts: datetime, with_date: bool = True) -> str:
+    """Format a timestamp to millisecond precision for display.
+
+    Uses isoformat rather than strftime plus slicing, which is cheaper and
+    not locale-dependent. Any UTC offset is left out, as with strftime.
+
+    Args:
+        ts: Timestamp to format
+        with_date: Include the date, otherwise only the time of day
+
+    Returns:
+        String like "2024-01-01 12:00:00.123" or "12:00:00.123"
+    """
+    if not with_date:
+        return ts.time().isoformat(timespec="milliseconds")
+    return ts.replace(tzinfo=None).isoformat(sep=" ", timespec="milliseconds")
+
+
+def pretty_json(obj: object) -> str:
+    """Serialize a parsed JSON value with 2-space indentation.
+
+    NaN and Infinity are kept as written, so copied and piped payloads
+    match what was received.
+
+    Args:
+        obj: Value to serialize, typically the result of json.loads
+
+    Returns:
+        Indented JSON text
+    """
+    return json.dumps(obj, indent=2)
+
+
+def encode_json(obj: object, indent: bool = False) -> bytes:
+    """Serialize a value to JSON bytes, for writing to binary files.
+
+    Args:
+        obj: Value to serialize
+        indent: Indent with 2 spaces instead of writing one line
+
+    Returns:
+        Encoded JSON
+    """
+    return json.dumps(obj, indent=2 if indent else None).encode()
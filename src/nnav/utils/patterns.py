@@ -1,6 +1,29 @@
 """NATS subject pattern matching utilities."""
 
-import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _pattern_tokens(pattern: str) -> tuple[str, ...]:
+    """Split a pattern into tokens, reusing the split for repeated patterns."""
+    return tuple(pattern.split("."))
+
+
+def is_nats_pattern(text: str) -> bool:
+    """Check if text uses NATS wildcards as whole tokens.
+
+    Only "*" or ">" standing alone between dots count as wildcards, so
+    "orders.*" is a pattern while "ord*" is plain text.
+
+    Args:
+        text: Filter text to check
+
+    Returns:
+        True if text should be matched with matches_nats_pattern
+    """
+    if "*" not in text and ">" not in text:
+        return False
+    return any(token in ("*", ">") for token in _pattern_tokens(text))
 
 
 def matches_nats_pattern(subject: str, pattern: str) -> bool:
@@ -10,6 +33,9 @@ def matches_nats_pattern(subject: str, pattern: str) -> bool:
     - * matches a single token (no dots)
     - > matches one or more tokens (greedy, only valid at end)
 
+    Wildcards only apply as whole tokens; "a*" is matched literally.
+    Neither wildcard matches an empty token.
+
     Args:
         subject: The NATS subject to check
         pattern: The pattern with optional wildcards
@@ -17,11 +43,15 @@ def matches_nats_pattern(subject: str, pattern: str) -> bool:
     Returns:
         True if subject matches the pattern
     """
-    # Convert NATS wildcards to regex
-    regex_pattern = (
-        pattern.replace(".", r"\.").replace("*", r"[^.]+").replace(">", r".+")
-    )
-    try:
-        return bool(re.match(f"^{regex_pattern}$", subject))
-    except re.error:
-        return False
+    subject_tokens = subject.split(".")
+    pattern_tokens = _pattern_tokens(pattern)
+    num_tokens = len(subject_tokens)
+    for i, token in enumerate(pattern_tokens):
+        if token == ">":
+            return i < num_tokens and all(subject_tokens[i:])
+        if i >= num_tokens:
+            return False
+        subject_token = subject_tokens[i]
+        if token != subject_token and (token != "*" or not subject_token):
+            return False
+    return num_tokens == len(pattern_tokens)
@@ -0,0 +1,52 @@
+"""Tests for MessageFilter."""
+
+from datetime import datetime
+
+import pytest
+
+from nnav.core.filter import MessageFilter
+from nnav.nats_client import NatsMessage
+
+
+def _message(subject: str, payload: str = "") -> NatsMessage:
+    return NatsMessage(subject=subject, payload=payload, timestamp=datetime(2024, 1, 1))
+
+
+def _matches(filter_text: str, msg: NatsMessage) -> bool:
+    message_filter = MessageFilter()
+    message_filter.parse(filter_text)
+    return message_filter.matches(msg)
+
+
+@pytest.mark.parametrize(
+    ("filter_text", "subject", "expected"),
+    [
+        ("orders.*", "orders.create", True),
+        ("orders.*", "orders.create.v2", False),
+        ("orders.>", "orders.create.v2", True),
+        ("orders.>", "orders", False),
+        ("*.create", "orders.create", True),
+        ("!orders.*", "orders.create", False),
+        ("!orders.*", "events.login", True),
+    ],
+)
+def test_whole_token_wildcards_match_subject(
+    filter_text: str, subject: str, expected: bool
+) -> None:
+    assert _matches(filter_text, _message(subject)) is expected
+
+
+@pytest.mark.parametrize(
+    ("filter_text", "msg", "expected"),
+    [
+        ("ord*", _message("orders.create"), False),
+        ("ord*", _message("events.login", "ord* literal"), True),
+        ("orders.cr*", _message("orders.create"), False),
+        ("orders.cr*", _message("ORDERS.CR*"), True),
+        ("a>b", _message("events", "if a>b then"), True),
+    ],
+)
+def test_partial_token_wildcards_fall_back_to_substring(
+    filter_text: str, msg: NatsMessage, expected: bool
+) -> None:
+    assert _matches(filter_text, msg) is expected
@@ -0,0 +1,35 @@
+"""Tests for formatting utilities."""
+
+import pytest
+
+from nnav.utils.formatting import format_bytes
+
+KB = 1024
+MB = KB * 1024
+GB = MB * 1024
+TB = GB * 1024
+PB = TB * 1024
+
+
+@pytest.mark.parametrize(
+    ("num_bytes", "expected"),
+    [
+        (0, "0.0 B"),
+        (1, "1.0 B"),
+        (1023, "1023.0 B"),
+        (KB, "1.0 KB"),
+        (KB + 512, "1.5 KB"),
+        (MB - 1, "1024.0 KB"),
+        (MB, "1.0 MB"),
+        (GB - 1, "1024.0 MB"),
+        (GB, "1.0 GB"),
+        (TB - 1, "1024.0 GB"),
+        (TB, "1.0 TB"),
+        (PB - 1, "1024.0 TB"),
+        (PB, "1.0 PB"),
+        (PB * 2048, "2048.0 PB"),
+        (-5, "-5.0 B"),
+    ],
+)
+def test_format_bytes(num_bytes: int, expected: str) -> None:
+    assert format_bytes(num_bytes) == expected
@@ -0,0 +1,41 @@
+"""Tests for JSON path query tokenizing."""
+
+import pytest
+
+from nnav.ui.screens import _parse_path
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("", ()),
+        ("$", ()),
+        (".name", ("name",)),
+        ("name", ("name",)),
+        ("$.user.name", ("user", "name")),
+        (".items[0]", ("items", 0)),
+        ("$.items[0].name", ("items", 0, "name")),
+        ("[2][10]", (2, 10)),
+        (".a..b", ("a", "b")),
+        ("  .a  ", ("a",)),
+        (".user-id.ünï", ("user-id", "ünï")),
+    ],
+)
+def test_parse_path(path: str, expected: tuple[str | int, ...]) -> None:
+    assert _parse_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    ("path", "message"),
+    [
+        (".items[0", "Unclosed '\\['"),
+        (".items[x]", "Invalid index \\[x\\]"),
+        (".items[-1]", "Invalid index \\[-1\\]"),
+        (".items[]", "Invalid index \\[\\]"),
+        (".items[١]", "Invalid index"),
+        (".items]", "Unexpected '\\]'"),
+    ],
+)
+def test_parse_path_errors(path: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _parse_path(path)
@@ -0,0 +1,66 @@
+"""Tests for message import and export."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from nnav.messages import export_messages, load_messages, parse_json_format
+from nnav.nats_client import MessageType, NatsMessage
+
+MESSAGES = [
+    NatsMessage(
+        subject="orders.create",
+        payload='{"id": 1, "note": "ünïcode"}',
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, 123000),
+        reply_to="_INBOX.abc",
+        headers={"X-Trace": "1"},
+        message_type=MessageType.REQUEST,
+    ),
+    NatsMessage(
+        subject="_INBOX.abc",
+        payload="line1\nline2\t\"quoted\"",
+        timestamp=datetime(2024, 1, 1, 12, 0, 1),
+        message_type=MessageType.RESPONSE,
+        latency_ms=12.5,
+        request_subject="orders.create",
+    ),
+    NatsMessage(
+        subject="events.login",
+        payload="NaN",
+        timestamp=datetime(2024, 1, 1, 12, 0, 2),
+    ),
+    # Binary payload, stored hex-encoded with its size on the wire
+    NatsMessage(
+        subject="events.blob",
+        payload=bytes([0xFF, 0x00, 0x80]).hex(),
+        timestamp=datetime(2024, 1, 1, 12, 0, 3),
+        payload_size=3,
+    ),
+]
+
+
+def test_json_export_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "out.json"
+    export_messages(MESSAGES, path, "json")
+    assert load_messages(path) == MESSAGES
+
+
+def test_ndjson_export_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "out.ndjson"
+    export_messages(MESSAGES, path, "ndjson")
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(MESSAGES)
+    assert parse_json_format([json.loads(line) for line in lines]) == MESSAGES
+
+
+def test_payload_size_survives_export(tmp_path: Path) -> None:
+    path = tmp_path / "out.json"
+    export_messages(MESSAGES, path, "json")
+    loaded = load_messages(path)
+    assert [m.payload_size for m in loaded] == [m.payload_size for m in MESSAGES]
+    assert loaded[-1].payload_size == 3
+
+
+def test_payload_size_derived_when_missing() -> None:
+    (msg,) = parse_json_format([{"subject": "a", "payload": "ünï"}])
+    assert msg.payload_size == 5
@@ -0,0 +1,106 @@
+"""Tests for NATS subject pattern matching."""
+
+import pytest
+
+from nnav.utils.patterns import is_nats_pattern, matches_nats_pattern
+
+
+@pytest.mark.parametrize(
+    ("subject", "pattern", "expected"),
+    [
+        ("orders.create", "orders.create", True),
+        ("orders.create", "orders.update", False),
+        ("orders.create", "orders", False),
+        ("orders", "orders.create", False),
+    ],
+)
+def test_literal(subject: str, pattern: str, expected: bool) -> None:
+    assert matches_nats_pattern(subject, pattern) is expected
+
+
+@pytest.mark.parametrize(
+    ("subject", "pattern", "expected"),
+    [
+        ("events.user.login", "events.*.login", True),
+        ("events.order.login", "events.*.login", True),
+        ("events.user.logout", "events.*.login", False),
+        ("events.user.login", "*.*.*", True),
+        ("events.user", "*.*.*", False),
+        ("events.user.login.extra", "events.*.login", False),
+        ("events", "*", True),
+    ],
+)
+def test_star_matches_single_token(subject: str, pattern: str, expected: bool) -> None:
+    assert matches_nats_pattern(subject, pattern) is expected
+
+
+@pytest.mark.parametrize(
+    ("subject", "pattern", "expected"),
+    [
+        ("events.user", "events.>", True),
+        ("events.user.login", "events.>", True),
+        ("events", "events.>", False),
+        ("other.user", "events.>", False),
+        ("anything.at.all", ">", True),
+        ("events.user.login", "events.*.>", True),
+        ("events.user", "events.*.>", False),
+        ("$JS.API.STREAM.INFO", "$JS.>", True),
+        ("$JS.API.STREAM.INFO", "$JS.API.*.INFO", True),
+    ],
+)
+def test_greater_than_matches_remaining_tokens(
+    subject: str, pattern: str, expected: bool
+) -> None:
+    assert matches_nats_pattern(subject, pattern) is expected
+
+
+@pytest.mark.parametrize(
+    ("subject", "pattern", "expected"),
+    [
+        ("orders", "ord*", False),
+        ("orders.create", "orders.cr*", False),
+        ("ord*", "ord*", True),
+        ("orders.a>", "orders.a>", True),
+        ("orders.abc", "orders.a>", False),
+    ],
+)
+def test_partial_token_wildcards_are_literal(
+    subject: str, pattern: str, expected: bool
+) -> None:
+    assert matches_nats_pattern(subject, pattern) is expected
+
+
+@pytest.mark.parametrize(
+    ("subject", "pattern", "expected"),
+    [
+        ("", "*", False),
+        ("", ">", False),
+        ("", "", True),
+        ("events..login", "events.*.login", False),
+        ("events..login", "events..login", True),
+        ("events.", "events.>", False),
+        ("events.", "events.*", False),
+        ("events.user.", "events.>", False),
+    ],
+)
+def test_empty_tokens(subject: str, pattern: str, expected: bool) -> None:
+    assert matches_nats_pattern(subject, pattern) is expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("orders.*", True),
+        ("orders.>", True),
+        ("*", True),
+        (">", True),
+        ("*.create", True),
+        ("ord*", False),
+        ("orders.cr*", False),
+        ("a>b", False),
+        ("orders.create", False),
+        ("", False),
+    ],
+)
+def test_is_nats_pattern_needs_whole_token_wildcards(text: str, expected: bool) -> None:
+    assert is_nats_pattern(text) is expected
@@ -0,0 +1,82 @@
+"""Tests for RpcTracker request timeouts."""
+
+from datetime import datetime
+
+import pytest
+
+from nnav.nats_client import MessageType, NatsMessage, RpcTracker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr("nnav.nats_client.time.monotonic", fake)
+    return fake
+
+
+def _request(subject: str, reply_to: str) -> NatsMessage:
+    return NatsMessage(
+        subject=subject,
+        payload="",
+        timestamp=datetime(2024, 1, 1),
+        reply_to=reply_to,
+        message_type=MessageType.REQUEST,
+    )
+
+
+def test_timed_out_requests_in_deadline_order(clock: _Clock) -> None:
+    tracker = RpcTracker(timeout_seconds=10)
+    tracker.track_request(_request("a", "_INBOX.1"))
+    clock.now = 5
+    tracker.track_request(_request("b", "_INBOX.2"))
+
+    clock.now = 12
+    assert [m.subject for m in tracker.get_timed_out_requests()] == ["a"]
+    assert tracker.pending_count == 1
+
+    clock.now = 16
+    assert [m.subject for m in tracker.get_timed_out_requests()] == ["b"]
+    assert tracker.pending_count == 0
+
+
+def test_reused_reply_subject_gets_new_deadline(clock: _Clock) -> None:
+    tracker = RpcTracker(timeout_seconds=10)
+    tracker.track_request(_request("a", "_INBOX.1"))
+    clock.now = 2
+    tracker.track_request(_request("b", "_INBOX.2"))
+    clock.now = 4
+    # Reusing the first reply subject moves it behind the second request
+    tracker.track_request(_request("c", "_INBOX.1"))
+
+    clock.now = 11
+    assert tracker.get_timed_out_requests() == []
+
+    clock.now = 13
+    assert [m.subject for m in tracker.get_timed_out_requests()] == ["b"]
+
+    clock.now = 15
+    assert [m.subject for m in tracker.get_timed_out_requests()] == ["c"]
+    assert tracker.pending_count == 0
+
+
+def test_matched_response_is_not_timed_out(clock: _Clock) -> None:
+    tracker = RpcTracker(timeout_seconds=10)
+    tracker.track_request(_request("a", "_INBOX.1"))
+    clock.now = 0.25
+    response = NatsMessage(
+        subject="_INBOX.1", payload="", timestamp=datetime(2024, 1, 1)
+    )
+    request = tracker.match_response(response)
+
+    assert request is not None and request.subject == "a"
+    assert response.latency_ms == 250
+    clock.now = 20
+    assert tracker.get_timed_out_requests() == []
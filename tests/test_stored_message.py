@@ -0,0 +1,37 @@
+"""Tests for StoredMessage payload formatting."""
+
+import json
+from datetime import datetime
+
+from nnav.nats_client import NatsMessage
+from nnav.ui.screens import StoredMessage
+from nnav.utils.formatting import pretty_json
+
+# Indented at the top level but with a compact nested object
+MIXED_PAYLOAD = '{\n  "a": {"b":1,"c":[1,2]},\n  "d": "x"\n}'
+
+
+def _stored(payload: str) -> StoredMessage:
+    msg = NatsMessage(subject="a", payload=payload, timestamp=datetime(2024, 1, 1))
+    return StoredMessage(msg=msg, row_key=None)
+
+
+def test_formatted_payload_normalizes_mixed_indentation() -> None:
+    stored = _stored(MIXED_PAYLOAD)
+    assert stored.formatted_payload() == pretty_json(json.loads(MIXED_PAYLOAD))
+
+
+def test_json_syntax_shows_indented_payload_as_received() -> None:
+    stored = _stored(MIXED_PAYLOAD)
+    assert stored.json_syntax("monokai").code == MIXED_PAYLOAD
+
+
+def test_json_syntax_formats_compact_payload() -> None:
+    payload = '{"a":{"b":1}}'
+    stored = _stored(payload)
+    assert stored.json_syntax("monokai").code == pretty_json(json.loads(payload))
+
+
+def test_formatted_payload_keeps_non_json() -> None:
+    stored = _stored("plain [red]text")
+    assert stored.formatted_payload() == "plain [red]text"